@@ -27,6 +27,25 @@ CREATE TABLE IF NOT EXISTS profile_versions (
     -- Parsed LinkedIn sections
     headline        VARCHAR(500),
     summary         TEXT,
+
+    -- PDF storage
+    pdf_storage_key VARCHAR(500),
+
+    is_current      BOOLEAN NOT NULL DEFAULT TRUE,
+    created_at      TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+
+    CONSTRAINT uq_user_version UNIQUE(user_id, version)
+);
+
+-- uq_user_version's (user_id, version) index serves MAX(version) / ORDER BY version DESC
+CREATE INDEX IF NOT EXISTS idx_profile_versions_user_id ON profile_versions(user_id);
+CREATE INDEX IF NOT EXISTS idx_profile_versions_current ON profile_versions(user_id)
+    INCLUDE (version, headline, created_at) WHERE is_current = TRUE;
+
+-- Parsed JSONB sections, 1:1 with profile_versions. Kept in a separate table so
+-- summary/list reads of profile_versions never touch the TOASTed blobs.
+CREATE TABLE IF NOT EXISTS profile_version_payloads (
+    profile_version_id UUID PRIMARY KEY REFERENCES profile_versions(id) ON DELETE CASCADE,
     experience      JSONB NOT NULL DEFAULT '[]',
     education       JSONB NOT NULL DEFAULT '[]',
     skills          JSONB NOT NULL DEFAULT '[]',
@@ -38,20 +57,9 @@ CREATE TABLE IF NOT EXISTS profile_versions (
     awards          JSONB NOT NULL DEFAULT '[]',
     projects        JSONB NOT NULL DEFAULT '[]',
     courses         JSONB NOT NULL DEFAULT '[]',
-    raw_parsed_data JSONB,
-
-    -- PDF storage
-    pdf_storage_key VARCHAR(500),
-
-    is_current      BOOLEAN NOT NULL DEFAULT TRUE,
-    created_at      TIMESTAMPTZ NOT NULL DEFAULT NOW(),
-
-    CONSTRAINT uq_user_version UNIQUE(user_id, version)
+    raw_parsed_data JSONB
 );
 
-CREATE INDEX IF NOT EXISTS idx_profile_versions_user_id ON profile_versions(user_id);
-CREATE INDEX IF NOT EXISTS idx_profile_versions_current ON profile_versions(user_id, is_current) WHERE is_current = TRUE;
-
 -- ============================================================================
 -- OUTREACH AGENT TABLES
 -- ============================================================================
@@ -91,6 +99,7 @@ CREATE TABLE IF NOT EXISTS outreach_contacts (
 CREATE INDEX IF NOT EXISTS idx_outreach_contacts_firm ON outreach_contacts(firm_id);
 CREATE INDEX IF NOT EXISTS idx_outreach_contacts_email ON outreach_contacts(email);
 CREATE INDEX IF NOT EXISTS idx_outreach_contacts_status ON outreach_contacts(status);
+CREATE INDEX IF NOT EXISTS idx_outreach_contacts_new ON outreach_contacts(id) WHERE status = 'new';
 CREATE INDEX IF NOT EXISTS idx_outreach_contacts_next_followup ON outreach_contacts(next_followup_at)
     WHERE next_followup_at IS NOT NULL;
 
@@ -129,6 +138,9 @@ CREATE TABLE IF NOT EXISTS conversation_messages (
 
 CREATE INDEX IF NOT EXISTS idx_messages_thread ON conversation_messages(thread_id);
 CREATE INDEX IF NOT EXISTS idx_messages_direction ON conversation_messages(direction);
+-- Gmail message ids are unique; inbound messages are inserted ON CONFLICT DO NOTHING
+-- Existing databases get this from services/outreach-agent/app/db/upgrade.py
+CREATE UNIQUE INDEX IF NOT EXISTS uq_messages_gmail_message_id ON conversation_messages(gmail_message_id);
 
 -- Agent audit log (every decision the agent makes)
 CREATE TABLE IF NOT EXISTS agent_actions (
@@ -167,6 +179,10 @@ CREATE TABLE IF NOT EXISTS agent_scheduled_tasks (
 
 CREATE INDEX IF NOT EXISTS idx_scheduled_tasks_status ON agent_scheduled_tasks(status, scheduled_for);
 CREATE INDEX IF NOT EXISTS idx_scheduled_tasks_contact ON agent_scheduled_tasks(contact_id);
+-- Live send tasks only: backs the orphaned-contact NOT EXISTS scan
+-- Existing databases get this and idx_outreach_contacts_new from services/outreach-agent/app/db/upgrade.py
+CREATE INDEX IF NOT EXISTS idx_scheduled_tasks_live_contact ON agent_scheduled_tasks(contact_id)
+    WHERE status IN ('pending', 'running') AND task_type IN ('send_initial', 'send_followup');
 
 -- Daily briefing records
 CREATE TABLE IF NOT EXISTS daily_briefings (
@@ -180,3 +196,11 @@ CREATE TABLE IF NOT EXISTS daily_briefings (
 );
 
 CREATE INDEX IF NOT EXISTS idx_briefings_date ON daily_briefings(briefing_date);
+
+-- Per-job checkpoints (e.g. the inbox watermark), locked by the running job.
+-- Existing databases get this from services/outreach-agent/app/db/upgrade.py
+CREATE TABLE IF NOT EXISTS agent_job_state (
+    name              VARCHAR(100) PRIMARY KEY,
+    last_run_at       TIMESTAMPTZ NOT NULL,
+    updated_at        TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
@@ -5,13 +5,18 @@ from sqlalchemy import pool
 from sqlalchemy.ext.asyncio import async_engine_from_config
 from alembic import context
 
+from app.config import settings
 from app.db.base import Base
-from app.models import User, ProfileVersion
+from app.models import User, ProfileVersion, ProfileVersionPayload
 
 config = context.config
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
+# Migrate the database the app itself is configured for (DATABASE_URL), not the
+# dev default in alembic.ini; % is escaped for configparser interpolation
+config.set_main_option("sqlalchemy.url", settings.database_url.replace("%", "%%"))
+
 target_metadata = Base.metadata
 
 
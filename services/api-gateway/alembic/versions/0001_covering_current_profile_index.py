@@ -0,0 +1,39 @@
+"""Covering partial index for the current profile lookup
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-16 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index("idx_profile_versions_current", table_name="profile_versions", if_exists=True)
+    op.create_index(
+        "idx_profile_versions_current",
+        "profile_versions",
+        ["user_id"],
+        postgresql_where=sa.text("is_current = true"),
+        postgresql_include=["version", "headline", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_profile_versions_current", table_name="profile_versions")
+    op.create_index(
+        "idx_profile_versions_current",
+        "profile_versions",
+        ["user_id", "is_current"],
+        postgresql_where=sa.text("is_current = true"),
+    )
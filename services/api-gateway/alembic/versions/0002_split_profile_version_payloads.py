@@ -0,0 +1,80 @@
+"""Move JSONB profile sections into profile_version_payloads
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-16 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SECTION_COLUMNS = (
+    "experience",
+    "education",
+    "skills",
+    "certifications",
+    "languages",
+    "volunteer",
+    "patents",
+    "publications",
+    "awards",
+    "projects",
+    "courses",
+)
+COLUMNS = ", ".join(SECTION_COLUMNS + ("raw_parsed_data",))
+
+
+def upgrade() -> None:
+    # Databases created from the current init.sql already have the split
+    # schema; only older ones still carry the section columns to move.
+    inspector = sa.inspect(op.get_bind())
+    if inspector.has_table("profile_version_payloads") and "experience" not in {
+        column["name"] for column in inspector.get_columns("profile_versions")
+    }:
+        return
+
+    op.create_table(
+        "profile_version_payloads",
+        sa.Column(
+            "profile_version_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("profile_versions.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        *[
+            sa.Column(name, postgresql.JSONB(), nullable=False, server_default=sa.text("'[]'"))
+            for name in SECTION_COLUMNS
+        ],
+        sa.Column("raw_parsed_data", postgresql.JSONB(), nullable=True),
+    )
+    op.execute(
+        f"INSERT INTO profile_version_payloads (profile_version_id, {COLUMNS}) "
+        f"SELECT id, {COLUMNS} FROM profile_versions"
+    )
+    for name in SECTION_COLUMNS + ("raw_parsed_data",):
+        op.drop_column("profile_versions", name)
+
+
+def downgrade() -> None:
+    for name in SECTION_COLUMNS:
+        op.add_column(
+            "profile_versions",
+            sa.Column(name, postgresql.JSONB(), nullable=False, server_default=sa.text("'[]'")),
+        )
+    op.add_column("profile_versions", sa.Column("raw_parsed_data", postgresql.JSONB(), nullable=True))
+    assignments = ", ".join(f"{name} = p.{name}" for name in SECTION_COLUMNS + ("raw_parsed_data",))
+    op.execute(
+        f"UPDATE profile_versions v SET {assignments} "
+        "FROM profile_version_payloads p WHERE p.profile_version_id = v.id"
+    )
+    op.drop_table("profile_version_payloads")
@@ -1,13 +1,33 @@
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 
 from app.config import settings
 
+
+def _orjson_dumps(value) -> str:
+    # SQLAlchemy expects a str from json_serializer; orjson returns bytes
+    return orjson.dumps(value).decode()
+
+
 engine = create_async_engine(
     settings.database_url,
     echo=False,
-    pool_size=20,
-    max_overflow=10,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
     pool_pre_ping=True,
+    pool_recycle=1800,  # drop connections older than 30 min (survives DB failover)
+    pool_timeout=30,
+    pool_use_lifo=True,  # reuse the most recently returned (warm) connection first
+    # The asyncpg dialect registers its own binary JSON/JSONB codec on every new
+    # connection; hand it orjson instead of the stdlib json module
+    json_serializer=_orjson_dumps,
+    json_deserializer=orjson.loads,
+    connect_args={
+        # SQLAlchemy keeps its own prepared-statement cache; disable asyncpg's duplicate one
+        "statement_cache_size": 0,
+        "prepared_statement_cache_size": 256,
+        "server_settings": {"jit": "off"},
+    },
 )
 
 async_session_factory = async_sessionmaker(
@@ -1,26 +1,57 @@
+import hashlib
+import time
 from datetime import datetime, timezone
 
+import httpx
 import jwt
-from fastapi import Depends, HTTPException, Header
+from cachetools import TTLCache
+from fastapi import Depends, HTTPException, Request
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config import settings
+from app.config import JWT_ALG, JWT_SECRET, settings
 from app.db.session import get_db
 from app.models.user import User
-from app.services.user_service import find_or_create_user
+from app.services.user_service import get_user_for_token
+
+# Decoded JWT payloads keyed by SHA-256 of the raw token.
+# Clients reuse the same bearer token for its whole lifetime, so this skips
+# the base64/JSON decode on repeat requests. Expiry is still checked on hit.
+_token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+
+# Reused codec with options normalized once
+_JWT = jwt.PyJWT(options={"require": ["exp"], "verify_signature": True, "verify_exp": True})
+_JWT_ALGS = [JWT_ALG]
+
+# auto_error=False so a missing/malformed header keeps returning 401 (not 403)
+_bearer = HTTPBearer(auto_error=False)
+
+
+def _decode_cached(token: str) -> dict:
+    key = hashlib.sha256(token.encode()).digest()
+    payload = _token_cache.get(key)
+    if payload is not None:
+        if payload["exp"] <= time.time():
+            _token_cache.pop(key, None)
+            raise jwt.ExpiredSignatureError("Signature has expired")
+        return payload
+
+    payload = _JWT.decode(token, key=JWT_SECRET, algorithms=_JWT_ALGS)
+    _token_cache[key] = payload
+    return payload
 
 
 async def get_current_user(
-    authorization: str = Header(...),
+    credentials: HTTPAuthorizationCredentials | None = Depends(_bearer),
     db: AsyncSession = Depends(get_db),
 ) -> User:
-    if not authorization.startswith("Bearer "):
+    if credentials is None:
         raise HTTPException(status_code=401, detail="Invalid authorization header")
 
-    token = authorization.removeprefix("Bearer ")
+    token = credentials.credentials
 
     try:
-        payload = jwt.decode(token, settings.jwt_secret, algorithms=[settings.jwt_algorithm])
+        payload = _decode_cached(token)
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token expired")
     except jwt.InvalidTokenError:
@@ -30,13 +61,26 @@ async def get_current_user(
     if not email:
         raise HTTPException(status_code=401, detail="Invalid token payload")
 
-    user = await find_or_create_user(db, email=email)
+    user = await get_user_for_token(db, email=email)
     return user
 
 
+async def auth_ctx(
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> tuple[User, AsyncSession]:
+    """Authenticated user plus the request's session (the same one get_current_user used)."""
+    return user, db
+
+
+def get_http(request: Request) -> httpx.AsyncClient:
+    """Shared keep-alive client created in the app lifespan."""
+    return request.app.state.http
+
+
 def create_access_token(email: str) -> str:
     from datetime import timedelta
 
     exp = datetime.now(timezone.utc) + timedelta(hours=settings.jwt_expiry_hours)
     payload = {"email": email, "exp": exp}
-    return jwt.encode(payload, settings.jwt_secret, algorithm=settings.jwt_algorithm)
+    return _JWT.encode(payload, JWT_SECRET, algorithm=JWT_ALG)
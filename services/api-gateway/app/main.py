@@ -1,10 +1,14 @@
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
+import httpx
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.services.storage_service import storage_service
+from app.services import parser_client
 from app.routers import health, auth, users, profiles, outreach
 from app.config import settings
 
@@ -16,12 +20,23 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     # Startup: ensure storage bucket exists
     try:
-        storage_service.ensure_bucket()
+        # Blocking boto3 call; keep it off the event loop
+        await asyncio.to_thread(storage_service.ensure_bucket)
         logger.info("Storage bucket ready")
     except Exception as e:
         logger.warning(f"Could not initialize storage bucket: {e}")
+
+    # Shared HTTP client for proxying to the outreach agent (keeps connections alive).
+    # HTTP/2 is negotiated via ALPN, so it only kicks in for https:// upstreams.
+    app.state.http = httpx.AsyncClient(
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        limits=httpx.Limits(max_keepalive_connections=100, max_connections=200, keepalive_expiry=30),
+        http2=True,
+    )
     yield
     # Shutdown
+    await app.state.http.aclose()
+    await parser_client.close_client()
     logger.info("Shutting down API gateway")
 
 
@@ -30,6 +45,7 @@ app = FastAPI(
     description="Phase-1: User profile management via LinkedIn PDF upload",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Build CORS origins: local/dev + any from env (e.g. Vercel frontend URL)
@@ -1,4 +1,5 @@
 from app.models.user import User
 from app.models.profile_version import ProfileVersion
+from app.models.profile_version_payload import ProfileVersionPayload
 
-__all__ = ["User", "ProfileVersion"]
+__all__ = ["User", "ProfileVersion", "ProfileVersionPayload"]
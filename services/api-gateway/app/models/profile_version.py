@@ -2,10 +2,12 @@ import uuid
 from datetime import datetime, timezone
 
 from sqlalchemy import String, Integer, Boolean, Text, DateTime, ForeignKey, UniqueConstraint, Index
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.associationproxy import association_proxy
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
+from app.models.profile_version_payload import ProfileVersionPayload
 
 
 class ProfileVersion(Base):
@@ -19,18 +21,6 @@ class ProfileVersion(Base):
 
     headline: Mapped[str | None] = mapped_column(String(500))
     summary: Mapped[str | None] = mapped_column(Text)
-    experience: Mapped[dict] = mapped_column(JSONB, nullable=False, default=list)
-    education: Mapped[dict] = mapped_column(JSONB, nullable=False, default=list)
-    skills: Mapped[dict] = mapped_column(JSONB, nullable=False, default=list)
-    certifications: Mapped[dict] = mapped_column(JSONB, nullable=False, default=list)
-    languages: Mapped[dict] = mapped_column(JSONB, nullable=False, default=list)
-    volunteer: Mapped[dict] = mapped_column(JSONB, nullable=False, default=list)
-    patents: Mapped[dict] = mapped_column(JSONB, nullable=False, default=list)
-    publications: Mapped[dict] = mapped_column(JSONB, nullable=False, default=list)
-    awards: Mapped[dict] = mapped_column(JSONB, nullable=False, default=list)
-    projects: Mapped[dict] = mapped_column(JSONB, nullable=False, default=list)
-    courses: Mapped[dict] = mapped_column(JSONB, nullable=False, default=list)
-    raw_parsed_data: Mapped[dict | None] = mapped_column(JSONB)
 
     pdf_storage_key: Mapped[str | None] = mapped_column(String(500))
     is_current: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
@@ -38,10 +28,40 @@ class ProfileVersion(Base):
         DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
     )
 
-    user: Mapped["User"] = relationship(back_populates="profile_versions")
+    user: Mapped["User"] = relationship(back_populates="profile_versions", lazy="raise_on_sql")
+    # JSONB sections; must be loaded explicitly with selectinload(ProfileVersion.payload)
+    payload: Mapped[ProfileVersionPayload] = relationship(
+        back_populates="profile_version",
+        uselist=False,
+        lazy="raise",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+
+    # Read-through accessors so detail schemas can keep reading version.experience etc.
+    experience = association_proxy("payload", "experience")
+    education = association_proxy("payload", "education")
+    skills = association_proxy("payload", "skills")
+    certifications = association_proxy("payload", "certifications")
+    languages = association_proxy("payload", "languages")
+    volunteer = association_proxy("payload", "volunteer")
+    patents = association_proxy("payload", "patents")
+    publications = association_proxy("payload", "publications")
+    awards = association_proxy("payload", "awards")
+    projects = association_proxy("payload", "projects")
+    courses = association_proxy("payload", "courses")
+    raw_parsed_data = association_proxy("payload", "raw_parsed_data")
 
     __table_args__ = (
+        # Its (user_id, version) btree also serves MAX(version) and ORDER BY version DESC
+        # per user via a backward scan, so no separate (user_id, version DESC) index
         UniqueConstraint("user_id", "version", name="uq_user_version"),
         Index("idx_profile_versions_user_id", "user_id"),
-        Index("idx_profile_versions_current", "user_id", "is_current", postgresql_where=(is_current == True)),
+        # Covering partial index: the current-version lookup can be answered index-only
+        Index(
+            "idx_profile_versions_current",
+            "user_id",
+            postgresql_where=(is_current == True),
+            postgresql_include=["version", "headline", "created_at"],
+        ),
     )
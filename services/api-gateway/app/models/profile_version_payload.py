@@ -0,0 +1,35 @@
+import uuid
+
+from sqlalchemy import ForeignKey
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.db.base import Base
+
+
+class ProfileVersionPayload(Base):
+    """Parsed JSONB sections of a profile version, stored 1:1 beside the summary row.
+
+    Kept out of profile_versions so list/summary reads never pull (or de-TOAST)
+    the large blobs; only detail endpoints load this table.
+    """
+
+    __tablename__ = "profile_version_payloads"
+
+    profile_version_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("profile_versions.id", ondelete="CASCADE"), primary_key=True
+    )
+    experience: Mapped[dict] = mapped_column(JSONB, nullable=False, default=list)
+    education: Mapped[dict] = mapped_column(JSONB, nullable=False, default=list)
+    skills: Mapped[dict] = mapped_column(JSONB, nullable=False, default=list)
+    certifications: Mapped[dict] = mapped_column(JSONB, nullable=False, default=list)
+    languages: Mapped[dict] = mapped_column(JSONB, nullable=False, default=list)
+    volunteer: Mapped[dict] = mapped_column(JSONB, nullable=False, default=list)
+    patents: Mapped[dict] = mapped_column(JSONB, nullable=False, default=list)
+    publications: Mapped[dict] = mapped_column(JSONB, nullable=False, default=list)
+    awards: Mapped[dict] = mapped_column(JSONB, nullable=False, default=list)
+    projects: Mapped[dict] = mapped_column(JSONB, nullable=False, default=list)
+    courses: Mapped[dict] = mapped_column(JSONB, nullable=False, default=list)
+    raw_parsed_data: Mapped[dict | None] = mapped_column(JSONB)
+
+    profile_version: Mapped["ProfileVersion"] = relationship(back_populates="payload", lazy="raise_on_sql")
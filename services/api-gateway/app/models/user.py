@@ -26,6 +26,7 @@ class User(Base):
         onupdate=lambda: datetime.now(timezone.utc),
     )
 
+    # Never lazy-load from async code; the FK's ON DELETE CASCADE removes versions
     profile_versions: Mapped[list["ProfileVersion"]] = relationship(
-        back_populates="user", cascade="all, delete-orphan"
+        back_populates="user", cascade="all, delete-orphan", lazy="raise_on_sql", passive_deletes=True
     )
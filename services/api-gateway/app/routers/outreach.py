@@ -4,25 +4,37 @@ import logging
 
 import httpx
 from fastapi import APIRouter, Depends, Request, UploadFile, File, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 
-from app.config import settings
-from app.dependencies import get_current_user
+from app.config import OUTREACH_URL
+from app.dependencies import get_current_user, get_http
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/outreach", tags=["outreach"])
 
-TIMEOUT = httpx.Timeout(30.0, connect=5.0)
 
+# Upstream headers worth relaying so client-side caching keeps working
+_FORWARDED_HEADERS = ("etag", "cache-control", "last-modified")
 
-async def _proxy_get(path: str, params: dict = None) -> JSONResponse:
+
+def _passthrough(resp: httpx.Response) -> Response:
+    """Relay the upstream body as-is instead of parsing and re-serializing it."""
+    headers = {name: resp.headers[name] for name in _FORWARDED_HEADERS if name in resp.headers}
+    return Response(
+        content=resp.content,
+        status_code=resp.status_code,
+        headers=headers,
+        media_type=resp.headers.get("content-type", "application/json"),
+    )
+
+
+async def _proxy_get(client: httpx.AsyncClient, path: str, params: dict = None) -> Response:
     """Forward GET request to outreach-agent service."""
-    url = f"{settings.outreach_agent_url}/api/v1{path}"
+    url = f"{OUTREACH_URL}/api/v1{path}"
     try:
-        async with httpx.AsyncClient(timeout=TIMEOUT) as client:
-            resp = await client.get(url, params=params)
-            return JSONResponse(content=resp.json(), status_code=resp.status_code)
+        resp = await client.get(url, params=params)
+        return _passthrough(resp)
     except httpx.ConnectError:
         raise HTTPException(status_code=503, detail="Outreach agent service unavailable")
     except Exception as e:
@@ -30,13 +42,12 @@ async def _proxy_get(path: str, params: dict = None) -> JSONResponse:
         raise HTTPException(status_code=502, detail=f"Proxy error: {str(e)}")
 
 
-async def _proxy_post(path: str, json_body: dict = None) -> JSONResponse:
+async def _proxy_post(client: httpx.AsyncClient, path: str, json_body: dict = None) -> Response:
     """Forward POST request to outreach-agent service."""
-    url = f"{settings.outreach_agent_url}/api/v1{path}"
+    url = f"{OUTREACH_URL}/api/v1{path}"
     try:
-        async with httpx.AsyncClient(timeout=TIMEOUT) as client:
-            resp = await client.post(url, json=json_body)
-            return JSONResponse(content=resp.json(), status_code=resp.status_code)
+        resp = await client.post(url, json=json_body)
+        return _passthrough(resp)
     except httpx.ConnectError:
         raise HTTPException(status_code=503, detail="Outreach agent service unavailable")
     except Exception as e:
@@ -50,17 +61,19 @@ async def _proxy_post(path: str, json_body: dict = None) -> JSONResponse:
 async def proxy_bulk_upload(
     file: UploadFile = File(...),
     user=Depends(get_current_user),
+    client: httpx.AsyncClient = Depends(get_http),
 ):
     """Proxy bulk upload to outreach agent."""
-    url = f"{settings.outreach_agent_url}/api/v1/firms/bulk-upload"
+    url = f"{OUTREACH_URL}/api/v1/firms/bulk-upload"
     try:
-        content = await file.read()
-        async with httpx.AsyncClient(timeout=TIMEOUT) as client:
-            resp = await client.post(
-                url,
-                files={"file": (file.filename, content, file.content_type)},
-            )
-            return JSONResponse(content=resp.json(), status_code=resp.status_code)
+        # Hand httpx the spooled file object so it streams the multipart body
+        # instead of buffering the whole upload in memory first.
+        await file.seek(0)
+        resp = await client.post(
+            url,
+            files={"file": (file.filename, file.file, file.content_type)},
+        )
+        return _passthrough(resp)
     except httpx.ConnectError:
         raise HTTPException(status_code=503, detail="Outreach agent service unavailable")
     except Exception as e:
@@ -69,40 +82,59 @@ async def proxy_bulk_upload(
 
 
 @router.get("/firms")
-async def proxy_list_firms(request: Request, user=Depends(get_current_user)):
-    return await _proxy_get("/firms", params=dict(request.query_params))
+async def proxy_list_firms(
+    request: Request,
+    user=Depends(get_current_user),
+    client: httpx.AsyncClient = Depends(get_http),
+):
+    return await _proxy_get(client, "/firms", params=dict(request.query_params))
 
 
 @router.get("/firms/{firm_id}")
-async def proxy_get_firm(firm_id: str, user=Depends(get_current_user)):
-    return await _proxy_get(f"/firms/{firm_id}")
+async def proxy_get_firm(
+    firm_id: str,
+    user=Depends(get_current_user),
+    client: httpx.AsyncClient = Depends(get_http),
+):
+    return await _proxy_get(client, f"/firms/{firm_id}")
 
 
 @router.post("/firms")
-async def proxy_create_firm(request: Request, user=Depends(get_current_user)):
+async def proxy_create_firm(
+    request: Request,
+    user=Depends(get_current_user),
+    client: httpx.AsyncClient = Depends(get_http),
+):
     body = await request.json()
-    return await _proxy_post("/firms", json_body=body)
+    return await _proxy_post(client, "/firms", json_body=body)
 
 
 @router.patch("/firms/{firm_id}")
-async def proxy_update_firm(firm_id: str, request: Request, user=Depends(get_current_user)):
-    url = f"{settings.outreach_agent_url}/api/v1/firms/{firm_id}"
+async def proxy_update_firm(
+    firm_id: str,
+    request: Request,
+    user=Depends(get_current_user),
+    client: httpx.AsyncClient = Depends(get_http),
+):
+    url = f"{OUTREACH_URL}/api/v1/firms/{firm_id}"
     body = await request.json()
     try:
-        async with httpx.AsyncClient(timeout=TIMEOUT) as client:
-            resp = await client.patch(url, json=body)
-            return JSONResponse(content=resp.json(), status_code=resp.status_code)
+        resp = await client.patch(url, json=body)
+        return _passthrough(resp)
     except httpx.ConnectError:
         raise HTTPException(status_code=503, detail="Outreach agent service unavailable")
 
 
 @router.delete("/firms/{firm_id}")
-async def proxy_delete_firm(firm_id: str, user=Depends(get_current_user)):
-    url = f"{settings.outreach_agent_url}/api/v1/firms/{firm_id}"
+async def proxy_delete_firm(
+    firm_id: str,
+    user=Depends(get_current_user),
+    client: httpx.AsyncClient = Depends(get_http),
+):
+    url = f"{OUTREACH_URL}/api/v1/firms/{firm_id}"
     try:
-        async with httpx.AsyncClient(timeout=TIMEOUT) as client:
-            resp = await client.delete(url)
-            return JSONResponse(content=None if resp.status_code == 204 else resp.json(), status_code=resp.status_code)
+        resp = await client.delete(url)
+        return _passthrough(resp)
     except httpx.ConnectError:
         raise HTTPException(status_code=503, detail="Outreach agent service unavailable")
 
@@ -110,37 +142,63 @@ async def proxy_delete_firm(firm_id: str, user=Depends(get_current_user)):
 # ── Outreach ──────────────────────────────────────────────
 
 @router.get("/threads")
-async def proxy_list_threads(request: Request, user=Depends(get_current_user)):
-    return await _proxy_get("/outreach/threads", params=dict(request.query_params))
+async def proxy_list_threads(
+    request: Request,
+    user=Depends(get_current_user),
+    client: httpx.AsyncClient = Depends(get_http),
+):
+    return await _proxy_get(client, "/outreach/threads", params=dict(request.query_params))
 
 
 @router.get("/threads/{thread_id}")
-async def proxy_get_thread(thread_id: str, user=Depends(get_current_user)):
-    return await _proxy_get(f"/outreach/threads/{thread_id}")
+async def proxy_get_thread(
+    thread_id: str,
+    user=Depends(get_current_user),
+    client: httpx.AsyncClient = Depends(get_http),
+):
+    return await _proxy_get(client, f"/outreach/threads/{thread_id}")
 
 
 @router.post("/trigger/{contact_id}")
-async def proxy_trigger_outreach(contact_id: str, user=Depends(get_current_user)):
-    return await _proxy_post(f"/outreach/trigger/{contact_id}")
+async def proxy_trigger_outreach(
+    contact_id: str,
+    user=Depends(get_current_user),
+    client: httpx.AsyncClient = Depends(get_http),
+):
+    return await _proxy_post(client, f"/outreach/trigger/{contact_id}")
 
 
 @router.get("/agent-status")
-async def proxy_agent_status(user=Depends(get_current_user)):
-    return await _proxy_get("/outreach/agent-status")
+async def proxy_agent_status(
+    user=Depends(get_current_user),
+    client: httpx.AsyncClient = Depends(get_http),
+):
+    return await _proxy_get(client, "/outreach/agent-status")
 
 
 # ── Metrics ───────────────────────────────────────────────
 
 @router.get("/metrics/summary")
-async def proxy_metrics_summary(user=Depends(get_current_user)):
-    return await _proxy_get("/metrics/summary")
+async def proxy_metrics_summary(
+    user=Depends(get_current_user),
+    client: httpx.AsyncClient = Depends(get_http),
+):
+    return await _proxy_get(client, "/metrics/summary")
 
 
 @router.get("/metrics/actions")
-async def proxy_metrics_actions(request: Request, user=Depends(get_current_user)):
-    return await _proxy_get("/metrics/actions", params=dict(request.query_params))
+async def proxy_metrics_actions(
+    request: Request,
+    user=Depends(get_current_user),
+    client: httpx.AsyncClient = Depends(get_http),
+):
+    return await _proxy_get(client, "/metrics/actions", params=dict(request.query_params))
 
 
 @router.get("/metrics/briefings")
-async def proxy_metrics_briefings(request: Request, user=Depends(get_current_user)):
-    return await _proxy_get("/metrics/briefings", params=dict(request.query_params))
+async def proxy_metrics_briefings(
+    request: Request,
+    user=Depends(get_current_user),
+    client: httpx.AsyncClient = Depends(get_http),
+):
+    return await _proxy_get(client, "/metrics/briefings", params=dict(request.query_params))
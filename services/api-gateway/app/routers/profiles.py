@@ -1,10 +1,10 @@
+import io
 import uuid
 
-from fastapi import APIRouter, Depends, UploadFile, File, HTTPException
+from fastapi import APIRouter, Depends, Request, UploadFile, File, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_db
-from app.dependencies import get_current_user
+from app.dependencies import auth_ctx
 from app.models.user import User
 from app.schemas.profile import (
     ProfileUploadResponse,
@@ -20,85 +20,93 @@ from app.services.profile_service import (
     get_version_by_id,
     get_dashboard_stats,
 )
+from app.services.response_cache import cached_response
 
 router = APIRouter(prefix="/profiles", tags=["profiles"])
 
 MAX_PDF_SIZE = 10 * 1024 * 1024  # 10MB
+UPLOAD_CHUNK_SIZE = 64 * 1024
 
+# Upload response fields filled straight from the parser output
+_UPLOAD_PARSED_FIELDS = ProfileUploadResponse.model_fields.keys() - {"profile_version_id", "version", "created_at"}
 
-@router.post("/upload", response_model=ProfileUploadResponse)
+
+# response_model=None: the body is built from trusted parser/DB values via
+# model_construct, so skip FastAPI's second validation pass on the way out.
+# The schema is still advertised through `responses`.
+@router.post(
+    "/upload",
+    response_model=None,
+    responses={200: {"model": ProfileUploadResponse}},
+)
 async def upload_linkedin_pdf(
     file: UploadFile = File(...),
-    user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    ctx: tuple[User, AsyncSession] = Depends(auth_ctx),
 ):
+    user, db = ctx
     if not file.filename or not file.filename.lower().endswith(".pdf"):
         raise HTTPException(status_code=400, detail="File must be a PDF")
 
-    contents = await file.read()
-    if len(contents) > MAX_PDF_SIZE:
-        raise HTTPException(status_code=400, detail="PDF exceeds 10MB limit")
-    if len(contents) == 0:
+    # Read in chunks so an oversized upload is rejected as soon as it crosses the
+    # limit. getvalue() hands over the BytesIO's own buffer without copying, and
+    # that one bytes object is what every downstream reader shares.
+    buffer = io.BytesIO()
+    total = 0
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        total += len(chunk)
+        if total > MAX_PDF_SIZE:
+            raise HTTPException(status_code=400, detail="PDF exceeds 10MB limit")
+        buffer.write(chunk)
+    if total == 0:
         raise HTTPException(status_code=400, detail="Empty file")
+    pdf_bytes = buffer.getvalue()
 
     try:
-        version, parsed = await upload_profile(db, user, contents, file.filename)
+        version, parsed = await upload_profile(db, user, pdf_bytes, file.filename)
     except Exception as e:
         raise HTTPException(status_code=502, detail=f"Profile parsing failed: {str(e)}")
 
-    return ProfileUploadResponse(
+    return ProfileUploadResponse.model_construct(
+        **{k: v for k, v in parsed.items() if k in _UPLOAD_PARSED_FIELDS},
         profile_version_id=version.id,
         version=version.version,
-        name=parsed.get("name"),
-        email=parsed.get("email"),
-        phone=parsed.get("phone"),
-        location=parsed.get("location"),
-        linkedin_url=parsed.get("linkedin_url"),
-        website_url=parsed.get("website_url"),
-        headline=version.headline,
-        summary=version.summary,
-        experience=version.experience,
-        education=version.education,
-        skills=version.skills,
-        skill_categories=parsed.get("skill_categories", []),
-        certifications=version.certifications,
-        languages=version.languages,
-        volunteer=version.volunteer,
-        patents=parsed.get("patents", []),
-        publications=version.publications,
-        awards=version.awards,
-        projects=version.projects,
-        courses=version.courses,
-        total_experience_years=parsed.get("total_experience_years"),
         created_at=version.created_at,
     )
 
 
 @router.get("/dashboard", response_model=DashboardStats)
 async def dashboard(
-    user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    ctx: tuple[User, AsyncSession] = Depends(auth_ctx),
 ):
-    stats = await get_dashboard_stats(db, user.id)
-    return DashboardStats(**stats)
+    user, db = ctx
+    async def build() -> DashboardStats:
+        stats = await get_dashboard_stats(db, user.id)
+        return DashboardStats.model_construct(**stats)
+
+    return await cached_response(request, "dashboard", user, build)
 
 
 @router.get("/current", response_model=ProfileVersionDetail)
 async def get_current(
-    user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    ctx: tuple[User, AsyncSession] = Depends(auth_ctx),
 ):
-    profile = await get_current_profile(db, user.id)
-    if not profile:
-        raise HTTPException(status_code=404, detail="No profile found")
-    return profile
+    user, db = ctx
+    async def build() -> ProfileVersionDetail:
+        profile = await get_current_profile(db, user.id)
+        if not profile:
+            raise HTTPException(status_code=404, detail="No profile found")
+        return ProfileVersionDetail.model_validate(profile)
+
+    return await cached_response(request, "current", user, build)
 
 
 @router.get("/versions", response_model=ProfileVersionList)
 async def list_versions(
-    user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    ctx: tuple[User, AsyncSession] = Depends(auth_ctx),
 ):
+    user, db = ctx
     versions = await get_all_versions(db, user.id)
     return ProfileVersionList(versions=[ProfileVersionSummary.model_validate(v) for v in versions])
 
@@ -106,9 +114,9 @@ async def list_versions(
 @router.get("/versions/{version_id}", response_model=ProfileVersionDetail)
 async def get_version(
     version_id: uuid.UUID,
-    user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    ctx: tuple[User, AsyncSession] = Depends(auth_ctx),
 ):
+    user, db = ctx
     version = await get_version_by_id(db, user.id, version_id)
     if not version:
         raise HTTPException(status_code=404, detail="Version not found")
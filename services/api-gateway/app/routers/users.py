@@ -1,26 +1,29 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_db
-from app.dependencies import get_current_user
+from app.dependencies import auth_ctx, get_current_user
 from app.models.user import User
 from app.schemas.user import UserResponse, UserUpdate
+from app.services.response_cache import cached_response
 from app.services.user_service import update_user
 
 router = APIRouter(prefix="/users", tags=["users"])
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_me(user: User = Depends(get_current_user)):
-    return user
+async def get_me(request: Request, user: User = Depends(get_current_user)):
+    async def build() -> UserResponse:
+        return UserResponse.model_validate(user)
+
+    return await cached_response(request, "me", user, build)
 
 
 @router.patch("/me", response_model=UserResponse)
 async def update_me(
     updates: UserUpdate,
-    user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    ctx: tuple[User, AsyncSession] = Depends(auth_ctx),
 ):
+    user, db = ctx
     updated = await update_user(
         db,
         user,
@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime
 from typing import Optional, Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class ProfileUploadResponse(BaseModel):
@@ -31,8 +31,7 @@ class ProfileUploadResponse(BaseModel):
     total_experience_years: Optional[int] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ProfileVersionSummary(BaseModel):
@@ -44,8 +43,7 @@ class ProfileVersionSummary(BaseModel):
     is_current: bool
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ProfileVersionDetail(BaseModel):
@@ -73,8 +71,7 @@ class ProfileVersionDetail(BaseModel):
     created_at: datetime
     raw_parsed_data: Optional[dict] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ProfileVersionList(BaseModel):
@@ -1,6 +1,8 @@
 import logging
+from typing import BinaryIO
 
 import httpx
+import orjson
 
 from app.config import settings
 
@@ -9,17 +11,36 @@ logger = logging.getLogger(__name__)
 PARSER_TIMEOUT = 30.0  # seconds
 MAX_RETRIES = 3
 
+_client: httpx.AsyncClient | None = None
 
-async def parse_linkedin_pdf(pdf_bytes: bytes, filename: str) -> dict:
+
+def _get_client() -> httpx.AsyncClient:
+    """Lazily create a single pooled client so connections to the parser are reused."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(timeout=PARSER_TIMEOUT)
+    return _client
+
+
+async def close_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+async def parse_linkedin_pdf(pdf_file: BinaryIO, filename: str) -> dict:
+    """Stream the PDF from a file-like object to the parser service."""
     url = f"{settings.parser_service_url}/parse/linkedin-pdf"
+    client = _get_client()
 
     for attempt in range(1, MAX_RETRIES + 1):
         try:
-            async with httpx.AsyncClient(timeout=PARSER_TIMEOUT) as client:
-                files = {"file": (filename, pdf_bytes, "application/pdf")}
-                response = await client.post(url, files=files)
-                response.raise_for_status()
-                return response.json()
+            pdf_file.seek(0)  # rewind for each attempt
+            files = {"file": (filename, pdf_file, "application/pdf")}
+            response = await client.post(url, files=files)
+            response.raise_for_status()
+            return orjson.loads(response.content)
         except httpx.HTTPStatusError as e:
             logger.error(f"Parser returned {e.response.status_code}: {e.response.text}")
             raise
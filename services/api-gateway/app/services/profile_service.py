@@ -1,18 +1,37 @@
+import asyncio
+import io
 import logging
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import select, func, update
+from sqlalchemy import Integer, cast, select, func, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, selectinload
 
 from app.models.profile_version import ProfileVersion
+from app.models.profile_version_payload import ProfileVersionPayload
 from app.models.user import User
 from app.services.storage_service import storage_service
 from app.services.parser_client import parse_linkedin_pdf
-from app.services.user_service import update_user
+from app.services.response_cache import invalidate_user
 
 logger = logging.getLogger(__name__)
 
+# Parser output keys stored verbatim as ProfileVersionPayload columns
+PAYLOAD_SECTIONS = (
+    "experience",
+    "education",
+    "skills",
+    "certifications",
+    "languages",
+    "volunteer",
+    "patents",
+    "publications",
+    "awards",
+    "projects",
+    "courses",
+)
+
 
 async def upload_profile(
     db: AsyncSession,
@@ -22,24 +41,38 @@ async def upload_profile(
 ) -> tuple["ProfileVersion", dict]:
     """Upload and parse LinkedIn PDF. Returns (profile_version, parsed_data)."""
 
-    # 1. Get next version number
-    result = await db.execute(
-        select(func.coalesce(func.max(ProfileVersion.version), 0))
-        .where(ProfileVersion.user_id == user.id)
-    )
-    current_max = result.scalar()
-    next_version = current_max + 1
-
-    # 2. Upload PDF to storage
-    storage_key = storage_service.upload_pdf(
-        user_id=str(user.id),
-        version=next_version,
-        file_bytes=pdf_bytes,
-        filename=filename,
-    )
-
-    # 3. Parse PDF via parser service
-    parsed = await parse_linkedin_pdf(pdf_bytes, filename)
+    # Storage and the parser each stream from their own reader; BytesIO over a
+    # bytes object shares its buffer instead of copying it.
+
+    async def store_pdf() -> tuple[int, str]:
+        # 1. Get next version number
+        result = await db.execute(
+            select(func.coalesce(func.max(ProfileVersion.version), 0))
+            .where(ProfileVersion.user_id == user.id)
+        )
+        next_version = result.scalar() + 1
+
+        # 2. Upload PDF to storage (blocking boto3 call, run in a worker thread)
+        storage_key = await asyncio.to_thread(
+            storage_service.upload_pdf,
+            user_id=str(user.id),
+            version=next_version,
+            file_obj=io.BytesIO(pdf_bytes),
+            filename=filename,
+        )
+        return next_version, storage_key
+
+    # 3. Parse PDF via parser service, overlapping with the version lookup + upload.
+    # If either side fails the TaskGroup cancels and awaits the other, so nothing
+    # is left using the session once the caller has returned.
+    try:
+        async with asyncio.TaskGroup() as tg:
+            store_task = tg.create_task(store_pdf())
+            parse_task = tg.create_task(parse_linkedin_pdf(io.BytesIO(pdf_bytes), filename))
+    except ExceptionGroup as eg:
+        raise eg.exceptions[0]
+    next_version, storage_key = store_task.result()
+    parsed = parse_task.result()
 
     # 4. Mark all existing versions as not current
     await db.execute(
@@ -56,39 +89,28 @@ async def upload_profile(
         source_filename=filename,
         headline=parsed.get("headline"),
         summary=parsed.get("summary"),
-        experience=parsed.get("experience", []),
-        education=parsed.get("education", []),
-        skills=parsed.get("skills", []),
-        certifications=parsed.get("certifications", []),
-        languages=parsed.get("languages", []),
-        volunteer=parsed.get("volunteer", []),
-        patents=parsed.get("patents", []),
-        publications=parsed.get("publications", []),
-        awards=parsed.get("awards", []),
-        projects=parsed.get("projects", []),
-        courses=parsed.get("courses", []),
-        raw_parsed_data=parsed,
         pdf_storage_key=storage_key,
         is_current=True,
     )
+    profile_version.payload = ProfileVersionPayload(
+        **{section: parsed.get(section, []) for section in PAYLOAD_SECTIONS},
+        raw_parsed_data=parsed,
+    )
     db.add(profile_version)
 
-    # 6. Update user fields from parsed data (always update, not just when empty)
-    update_fields = {}
-    if parsed.get("name"):
-        update_fields["name"] = parsed["name"]
-    if parsed.get("phone"):
-        update_fields["phone"] = parsed["phone"]
-    if parsed.get("location"):
-        update_fields["location"] = parsed["location"]
-    if parsed.get("linkedin_url"):
-        update_fields["linkedin_url"] = parsed["linkedin_url"]
-
-    if update_fields:
-        await update_user(db, user, **update_fields)
+    # 6. Update user fields from parsed data (always update, not just when empty).
+    # Flushed with the new version in the single commit below.
+    for field in ("name", "phone", "location", "linkedin_url"):
+        if parsed.get(field):
+            setattr(user, field, parsed[field])
+    # Always bumped, even when no field changed: cached /current and /dashboard
+    # bodies in every worker are validated against it
+    user.updated_at = datetime.now(timezone.utc)
 
     await db.commit()
-    await db.refresh(profile_version)
+    invalidate_user(user.id)
+    # No refresh: all columns are client-side defaults, and a refresh would expire
+    # the lazy="raise" payload the caller reads from
     return profile_version, parsed
 
 
@@ -96,17 +118,31 @@ async def get_current_profile(db: AsyncSession, user_id: uuid.UUID) -> ProfileVe
     result = await db.execute(
         select(ProfileVersion)
         .where(ProfileVersion.user_id == user_id, ProfileVersion.is_current == True)
+        .options(selectinload(ProfileVersion.payload))
     )
     return result.scalar_one_or_none()
 
 
 async def get_all_versions(db: AsyncSession, user_id: uuid.UUID) -> list[ProfileVersion]:
+    """Version history rows, loading only the columns ProfileVersionSummary reads."""
     result = await db.execute(
         select(ProfileVersion)
         .where(ProfileVersion.user_id == user_id)
         .order_by(ProfileVersion.version.desc())
+        .options(
+            load_only(
+                ProfileVersion.id,
+                ProfileVersion.version,
+                ProfileVersion.source_type,
+                ProfileVersion.source_filename,
+                ProfileVersion.headline,
+                ProfileVersion.is_current,
+                ProfileVersion.created_at,
+                raiseload=True,
+            )
+        )
     )
-    return list(result.scalars().all())
+    return result.scalars().all()
 
 
 async def get_version_by_id(
@@ -115,15 +151,58 @@ async def get_version_by_id(
     result = await db.execute(
         select(ProfileVersion)
         .where(ProfileVersion.id == version_id, ProfileVersion.user_id == user_id)
+        .options(selectinload(ProfileVersion.payload))
     )
     return result.scalar_one_or_none()
 
 
 async def get_dashboard_stats(db: AsyncSession, user_id: uuid.UUID) -> dict:
-    """Calculate dashboard statistics for a user."""
-    versions = await get_all_versions(db, user_id)
+    """Calculate dashboard statistics for a user in a single round-trip."""
+    payload = ProfileVersionPayload
+    total_versions = (
+        select(func.count())
+        .select_from(ProfileVersion)
+        .where(ProfileVersion.user_id == user_id)
+        .scalar_subquery()
+    )
+
+    def _array_len(column):
+        return func.coalesce(func.jsonb_array_length(column), 0)
+
+    def _present(condition):
+        return cast(condition, Integer)
 
-    if not versions:
+    # One row for the current version (falling back to the latest), with the
+    # counts computed in Postgres so no JSONB blob is shipped to the app.
+    # Kept as a single statement rather than gathered queries: an AsyncSession
+    # can't run concurrent statements, and one round-trip beats two anyway.
+    result = await db.execute(
+        select(
+            total_versions.label("total_versions"),
+            ProfileVersion.version,
+            cast(func.extract("day", func.now() - ProfileVersion.created_at), Integer).label("days_since"),
+            _array_len(payload.experience).label("roles"),
+            _array_len(payload.skills).label("skills"),
+            # headline, summary, experience, education, skills, languages, certifications
+            (
+                _present(func.coalesce(ProfileVersion.headline, "") != "")
+                + _present(func.coalesce(ProfileVersion.summary, "") != "")
+                + _present(_array_len(payload.experience) > 0)
+                + _present(_array_len(payload.education) > 0)
+                + _present(_array_len(payload.skills) > 0)
+                + _present(_array_len(payload.languages) > 0)
+                + _present(_array_len(payload.certifications) > 0)
+            ).label("sections_present"),
+            payload.raw_parsed_data["total_experience_years"].as_integer().label("total_experience_years"),
+        )
+        .outerjoin(payload, payload.profile_version_id == ProfileVersion.id)
+        .where(ProfileVersion.user_id == user_id)
+        .order_by(ProfileVersion.is_current.desc(), ProfileVersion.version.desc())
+        .limit(1)
+    )
+    row = result.one_or_none()
+
+    if row is None:
         return {
             "total_resumes_uploaded": 0,
             "days_since_last_update": None,
@@ -134,45 +213,16 @@ async def get_dashboard_stats(db: AsyncSession, user_id: uuid.UUID) -> dict:
             "profile_completeness": 0,
         }
 
-    current = next((v for v in versions if v.is_current), versions[0])
-    now = datetime.now(timezone.utc)
-    last_upload = current.created_at
-    if last_upload.tzinfo is None:
-        from datetime import timezone as tz
-        last_upload = last_upload.replace(tzinfo=tz.utc)
-    days_since = (now - last_upload).days
-
     # Profile completeness
-    sections_present = 0
-    total_sections = 7  # headline, summary, experience, education, skills, languages, certifications
-    if current.headline:
-        sections_present += 1
-    if current.summary:
-        sections_present += 1
-    if current.experience:
-        sections_present += 1
-    if current.education:
-        sections_present += 1
-    if current.skills:
-        sections_present += 1
-    if current.languages:
-        sections_present += 1
-    if current.certifications:
-        sections_present += 1
-
-    completeness = int((sections_present / total_sections) * 100)
-
-    # Total experience years from raw_parsed_data
-    total_exp_years = None
-    if current.raw_parsed_data:
-        total_exp_years = current.raw_parsed_data.get("total_experience_years")
+    total_sections = 7
+    completeness = int((row.sections_present / total_sections) * 100)
 
     return {
-        "total_resumes_uploaded": len(versions),
-        "days_since_last_update": days_since,
-        "current_version": current.version,
-        "total_experience_years": total_exp_years,
-        "total_skills": len(current.skills) if current.skills else 0,
-        "total_roles": len(current.experience) if current.experience else 0,
+        "total_resumes_uploaded": row.total_versions,
+        "days_since_last_update": row.days_since,
+        "current_version": row.version,
+        "total_experience_years": row.total_experience_years,
+        "total_skills": row.skills,
+        "total_roles": row.roles,
         "profile_completeness": completeness,
     }
@@ -0,0 +1,56 @@
+"""Short-lived per-user cache of polled GET responses, served with ETags.
+
+The frontend polls /profiles/dashboard, /profiles/current and /users/me, which
+only change on an upload or profile edit. Bodies are cached per user for a few
+seconds and a matching If-None-Match gets a bodyless 304.
+
+Each entry records the users.updated_at it was built under. Every write that
+changes a cached body bumps that column, and the authenticated user row is
+read on each request anyway, so a worker that did not handle the write still
+sees the entry is stale and rebuilds it.
+"""
+
+import hashlib
+import uuid
+from typing import Awaitable, Callable
+
+import orjson
+from cachetools import TTLCache
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+from app.models.user import User
+
+# (kind, user_id) -> (updated_at, body, etag). Per process; writers invalidate
+# their own worker explicitly and the updated_at check catches the others.
+_response_cache: TTLCache = TTLCache(maxsize=10_000, ttl=10)
+
+CACHED_KINDS = ("dashboard", "current", "me")
+
+
+def invalidate_user(user_id: uuid.UUID) -> None:
+    for kind in CACHED_KINDS:
+        _response_cache.pop((kind, user_id), None)
+
+
+async def cached_response(
+    request: Request,
+    kind: str,
+    user: User,
+    build: Callable[[], Awaitable[BaseModel]],
+) -> Response:
+    """Return the cached body for (kind, user), rebuilding it on a miss or after a write."""
+    key = (kind, user.id)
+    entry = _response_cache.get(key)
+    if entry is None or entry[0] != user.updated_at:
+        model = await build()
+        body = orjson.dumps(model.model_dump(mode="json"))
+        etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+        entry = (user.updated_at, body, etag)
+        _response_cache[key] = entry
+
+    _, body, etag = entry
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -1,6 +1,8 @@
 import logging
+from typing import BinaryIO
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config as BotoConfig
 from botocore.exceptions import ClientError
 
@@ -8,6 +10,14 @@ from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Multipart above 5MB with parts uploaded in parallel; PDFs are capped at 10MB
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=5 * 1024 * 1024,
+    multipart_chunksize=5 * 1024 * 1024,
+    max_concurrency=8,
+    use_threads=True,
+)
+
 
 class StorageService:
     def __init__(self):
@@ -16,7 +26,7 @@ class StorageService:
             endpoint_url=settings.storage_endpoint,
             aws_access_key_id=settings.storage_access_key,
             aws_secret_access_key=settings.storage_secret_key,
-            config=BotoConfig(signature_version="s3v4"),
+            config=BotoConfig(signature_version="s3v4", max_pool_connections=32),
             region_name="us-east-1",
         )
         self.bucket = settings.storage_bucket
@@ -25,18 +35,21 @@ class StorageService:
         try:
             self.client.head_bucket(Bucket=self.bucket)
         except ClientError:
-            logger.info(f"Creating bucket: {self.bucket}")
+            logger.info("Creating bucket: %s", self.bucket)
             self.client.create_bucket(Bucket=self.bucket)
 
-    def upload_pdf(self, user_id: str, version: int, file_bytes: bytes, filename: str) -> str:
+    def upload_pdf(self, user_id: str, version: int, file_obj: BinaryIO, filename: str) -> str:
+        """Blocking; call via asyncio.to_thread from async code."""
         key = f"profiles/{user_id}/v{version}/{filename}"
-        self.client.put_object(
-            Bucket=self.bucket,
-            Key=key,
-            Body=file_bytes,
-            ContentType="application/pdf",
+        file_obj.seek(0)
+        self.client.upload_fileobj(
+            file_obj,
+            self.bucket,
+            key,
+            ExtraArgs={"ContentType": "application/pdf"},
+            Config=TRANSFER_CONFIG,
         )
-        logger.info(f"Uploaded PDF: {key}")
+        logger.info("Uploaded PDF: %s", key)
         return key
 
     def get_presigned_url(self, key: str, expires_in: int = 3600) -> str:
@@ -1,9 +1,15 @@
 import uuid
 
+from cachetools import TTLCache
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user import User
+from app.services.response_cache import invalidate_user
+
+# email -> User.id for authenticated lookups; a primary-key fetch is cheaper
+# than the unique-index email lookup done by find_or_create_user.
+_user_id_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
 
 
 async def find_or_create_user(db: AsyncSession, email: str, name: str | None = None) -> User:
@@ -20,6 +26,23 @@ async def find_or_create_user(db: AsyncSession, email: str, name: str | None = N
     return user
 
 
+async def get_user_for_token(db: AsyncSession, email: str) -> User:
+    """Resolve the authenticated user, using the cached id when available."""
+    user_id = _user_id_cache.get(email)
+    if user_id is not None:
+        user = await db.get(User, user_id)
+        if user:
+            return user
+
+    user = await find_or_create_user(db, email=email)
+    _user_id_cache[email] = user.id
+    return user
+
+
+def pop_user_cache(email: str) -> None:
+    _user_id_cache.pop(email, None)
+
+
 async def get_user_by_email(db: AsyncSession, email: str) -> User | None:
     result = await db.execute(select(User).where(User.email == email))
     return result.scalar_one_or_none()
@@ -34,6 +57,8 @@ async def update_user(db: AsyncSession, user: User, **kwargs) -> User:
     for key, value in kwargs.items():
         if value is not None and hasattr(user, key):
             setattr(user, key, value)
+    pop_user_cache(user.email)
     await db.commit()
     await db.refresh(user)
+    invalidate_user(user.id)
     return user
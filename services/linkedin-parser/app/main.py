@@ -1,26 +1,39 @@
 import logging
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, UploadFile, File, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
-from app.parser.pipeline import parse_linkedin_pdf
+from app.parser.pipeline import parse_cache_info, parse_linkedin_pdf
 from app.parser.models import ParsedProfile
+from app.parser.text_extractor import shutdown_process_pool
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Extraction workers are started lazily on the first long PDF
+    shutdown_process_pool()
+
+
 app = FastAPI(
     title="Suchi LinkedIn Parser",
     description="Stateless LinkedIn PDF parsing service",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 MAX_PDF_SIZE = 10 * 1024 * 1024  # 10MB
+UPLOAD_CHUNK_SIZE = 64 * 1024
 
 
 @app.get("/health")
 async def health():
-    return {"status": "healthy", "service": "linkedin-parser"}
+    return {"status": "healthy", "service": "linkedin-parser", "parse_cache": parse_cache_info()}
 
 
 @app.post("/parse/linkedin-pdf", response_model=ParsedProfile)
@@ -28,13 +41,20 @@ async def parse_pdf(file: UploadFile = File(...)):
     if not file.filename or not file.filename.lower().endswith(".pdf"):
         raise HTTPException(status_code=400, detail="File must be a PDF")
 
-    contents = await file.read()
-    if len(contents) > MAX_PDF_SIZE:
-        raise HTTPException(status_code=400, detail="PDF exceeds 10MB size limit")
+    # Read in chunks so an oversized upload is rejected once it crosses the limit
+    chunks: list[bytes] = []
+    total = 0
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        total += len(chunk)
+        if total > MAX_PDF_SIZE:
+            raise HTTPException(status_code=400, detail="PDF exceeds 10MB size limit")
+        chunks.append(chunk)
 
-    if len(contents) == 0:
+    if total == 0:
         raise HTTPException(status_code=400, detail="Empty PDF file")
 
+    contents = b"".join(chunks)
+
     try:
         profile = parse_linkedin_pdf(contents)
         return profile
@@ -1,6 +1,9 @@
+import hashlib
 import logging
+from collections import OrderedDict
+from functools import lru_cache
 
-from app.parser.models import ParsedProfile
+from app.parser.models import EducationEntry, ExperienceEntry, LanguageEntry, ParsedProfile, SkillCategory
 from app.parser.text_extractor import extract_text
 from app.parser.section_detector import detect_sections
 from app.parser.section_parsers.experience import parse_experience
@@ -24,15 +27,72 @@ from app.parser.validators import (
 
 logger = logging.getLogger(__name__)
 
+# LRU of parsed results keyed by a digest of the PDF bytes. The parser is
+# stateless, so re-uploads and retries of the same file skip the whole pipeline.
+# Values are model_dump() dicts so callers never share a mutable profile.
+PARSE_CACHE_SIZE = 256
+_parse_cache: "OrderedDict[bytes, dict]" = OrderedDict()
+_cache_stats = {"hits": 0, "misses": 0}
+
+
+def parse_cache_info() -> dict:
+    return {**_cache_stats, "maxsize": PARSE_CACHE_SIZE, "currsize": len(_parse_cache)}
+
+
+# Section-level memo for the heavier parsers. A re-exported profile with a few
+# edits misses the whole-PDF cache above but usually repeats most sections
+# verbatim. The cached entries are mutable models shared by every hit, so
+# each profile gets its own copies (see _copies).
+SECTION_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=SECTION_CACHE_SIZE)
+def _experience_cached(text: str) -> tuple[ExperienceEntry, ...]:
+    return tuple(parse_experience(text))
+
+
+@lru_cache(maxsize=SECTION_CACHE_SIZE)
+def _education_cached(text: str) -> tuple[EducationEntry, ...]:
+    return tuple(parse_education(text))
+
+
+@lru_cache(maxsize=SECTION_CACHE_SIZE)
+def _skills_cached(
+    text: str,
+) -> tuple[tuple[str, ...], tuple[SkillCategory, ...], tuple[LanguageEntry, ...]]:
+    flat_skills, skill_categories, languages = parse_skills(text)
+    return tuple(flat_skills), tuple(skill_categories), tuple(languages)
+
+
+def _copies(entries, deep: bool = False) -> list:
+    """Per-profile copies of cached section entries, so edits never reach the cache."""
+    return [entry.model_copy(deep=deep) for entry in entries]
+
 
 def parse_linkedin_pdf(pdf_bytes: bytes) -> ParsedProfile:
+    key = hashlib.blake2b(pdf_bytes, digest_size=16).digest()
+    cached = _parse_cache.get(key)
+    if cached is not None:
+        _parse_cache.move_to_end(key)
+        _cache_stats["hits"] += 1
+        return ParsedProfile.model_validate(cached)
+
+    _cache_stats["misses"] += 1
+    profile = _parse(pdf_bytes)
+    _parse_cache[key] = profile.model_dump()
+    if len(_parse_cache) > PARSE_CACHE_SIZE:
+        _parse_cache.popitem(last=False)
+    return profile
+
+
+def _parse(pdf_bytes: bytes) -> ParsedProfile:
     # Step 1: Extract raw text
     raw_text = extract_text(pdf_bytes)
-    logger.info(f"Extracted {len(raw_text)} characters from PDF")
+    logger.info("Extracted %d characters from PDF", len(raw_text))
 
     # Step 2: Detect sections
     sections = detect_sections(raw_text)
-    logger.info(f"Detected sections: {list(sections.keys())}")
+    logger.info("Detected sections: %s", list(sections))
 
     # Step 3: Build profile from sections
     profile = ParsedProfile(raw_text=raw_text)
@@ -47,21 +107,22 @@ def parse_linkedin_pdf(pdf_bytes: bytes) -> ParsedProfile:
 
     # Experience
     if "experience" in sections:
-        profile.experience = parse_experience(sections["experience"])
+        profile.experience = _copies(_experience_cached(sections["experience"]))
 
     # Education
     if "education" in sections:
-        profile.education = parse_education(sections["education"])
+        profile.education = _copies(_education_cached(sections["education"]))
 
     # Skills — new parser returns (flat_skills, categories, languages_from_skills)
     if "skills" in sections:
-        flat_skills, skill_categories, languages_from_skills = parse_skills(sections["skills"])
+        flat_skills, skill_categories, languages_from_skills = _skills_cached(sections["skills"])
         profile.skills = deduplicate_skills(flat_skills)
-        profile.skill_categories = skill_categories
+        # Deep: a category's skills list is itself mutable
+        profile.skill_categories = _copies(skill_categories, deep=True)
 
         # Merge languages found in skills section
         if languages_from_skills:
-            profile.languages.extend(languages_from_skills)
+            profile.languages.extend(_copies(languages_from_skills))
 
     # Standalone languages section (if separate from skills)
     if "languages" in sections:
@@ -95,17 +156,24 @@ def parse_linkedin_pdf(pdf_bytes: bytes) -> ParsedProfile:
 
     # Calculate total experience years
     profile.total_experience_years = calculate_experience_years(
-        [e.model_dump() for e in profile.experience]
+        (e.start_date, e.end_date) for e in profile.experience
     )
 
     logger.info(
-        f"Parsed profile: name={profile.name}, email={profile.email}, "
-        f"phone={profile.phone}, location={profile.location}, "
-        f"headline={profile.headline}, linkedin={profile.linkedin_url}, "
-        f"experience={len(profile.experience)} ({profile.total_experience_years}y), "
-        f"education={len(profile.education)}, "
-        f"skills={len(profile.skills)} in {len(profile.skill_categories)} categories, "
-        f"languages={len(profile.languages)}"
+        "Parsed profile: name=%s, email=%s, phone=%s, location=%s, headline=%s, linkedin=%s, "
+        "experience=%d (%sy), education=%d, skills=%d in %d categories, languages=%d",
+        profile.name,
+        profile.email,
+        profile.phone,
+        profile.location,
+        profile.headline,
+        profile.linkedin_url,
+        len(profile.experience),
+        profile.total_experience_years,
+        len(profile.education),
+        len(profile.skills),
+        len(profile.skill_categories),
+        len(profile.languages),
     )
 
     return profile
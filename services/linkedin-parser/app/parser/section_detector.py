@@ -1,11 +1,14 @@
 import re
 import logging
+from bisect import bisect_right
+from itertools import accumulate
 
 logger = logging.getLogger(__name__)
 
 # LinkedIn PDF section headings - match both ALL CAPS and Title Case
-# Order matters: more specific patterns first to avoid false matches
-SECTION_PATTERNS = [
+# Order matters: more specific patterns first to avoid false matches.
+# Compiled once, as a single alternation, into _SECTION_RE below.
+SECTION_PATTERNS = (
     ("summary", r"^(?:SUMMARY|Summary|ABOUT|About)\s*$"),
     ("experience", r"^(?:WORK\s+EXPERIENCE|EXPERIENCE|Work\s+Experience|Experience)\s*$"),
     ("earlier_experience", r"^(?:EARLIER\s+EXPERIENCE|Earlier\s+Experience)\s*$"),
@@ -22,14 +25,66 @@ SECTION_PATTERNS = [
     ("recommendations", r"^(?:RECOMMENDATIONS?|Recommendations?)\s*$"),
     ("interests", r"^(?:INTERESTS?|Interests?)\s*$"),
     ("organizations", r"^(?:ORGANIZATIONS?|Organizations?)\s*$"),
-]
+)
+
+
+def _build_section_re(patterns: tuple[tuple[str, str], ...]) -> re.Pattern:
+    """Fold SECTION_PATTERNS into one MULTILINE alternation of named groups.
+
+    Alternatives are tried in list order, so the first full-line match wins just
+    as with the per-pattern loop. Whitespace classes are narrowed to exclude
+    newlines so a heading can never span two lines of the whole-text scan.
+    """
+    alternatives = []
+    for name, pattern in patterns:
+        body = re.sub(r"^\^|\\s\*\$$", "", pattern).replace(r"\s", r"[^\S\n]")
+        alternatives.append(f"(?P<{name}>{body})")
+    return re.compile(r"^[^\S\n]*(?:" + "|".join(alternatives) + r")[^\S\n]*$", re.MULTILINE)
+
+
+_SECTION_RE = _build_section_re(SECTION_PATTERNS)
+
+# "=== PAGE N ===" extractor markers, then LinkedIn's "Page N of M" footers.
+# Applied in that order: removing a marker can expose a footer line ending.
+_PAGE_SEPARATOR_RE = re.compile(r"=== PAGE \d+ ===\n?")
+_PAGE_FOOTER_RE = re.compile(r"^Page\s+\d+\s+of\s+\d+\s*$", re.MULTILINE)
 
 # Sidebar-only sections (appear in LinkedIn PDF sidebar, interleaved with main content)
-SIDEBAR_SECTIONS = {"skills", "languages", "awards", "patents", "publications"}
+SIDEBAR_SECTIONS = frozenset({"skills", "languages", "awards", "patents", "publications"})
 
 # Page markers
 PAGE_MARKER = re.compile(r"^Page\s+\d+\s+of\s+\d+\s*$", re.IGNORECASE)
 
+# Sidebar item scan (two-column layout): lines searched after each sidebar
+# heading, and how many items are taken per heading.
+SIDEBAR_WINDOW = 11
+SIDEBAR_MAX_ITEMS = 3
+
+# "English (Full Professional)" or just "English"
+_LANG_RE = re.compile(r"^[A-Z]\w+(?:\s*\([^)]+\))?\s*$")
+
+
+def _is_skill_item(stripped: str) -> bool:
+    """Skills are short 1-4 word Title Case phrases."""
+    if len(stripped) >= 30 or not stripped[0].isupper() or stripped.endswith("."):
+        return False
+    return 1 <= len(stripped.split()) <= 4
+
+
+def _is_language_item(stripped: str) -> bool:
+    return len(stripped) < 45 and _LANG_RE.match(stripped) is not None
+
+
+def _is_short_title(stripped: str) -> bool:
+    """Awards, patents, publications: short titles."""
+    return len(stripped) < 45 and stripped[0].isupper()
+
+
+_SIDEBAR_CLASSIFIERS = {
+    "skills": _is_skill_item,
+    "languages": _is_language_item,
+}
+
 
 def detect_sections(text: str) -> dict[str, str]:
     """
@@ -40,21 +95,20 @@ def detect_sections(text: str) -> dict[str, str]:
     - "Earlier Experience" merged into experience
     """
     # Remove page markers
-    text = re.sub(r"=== PAGE \d+ ===\n?", "", text)
-    text = re.sub(r"^Page\s+\d+\s+of\s+\d+\s*$", "", text, flags=re.MULTILINE)
+    # Substring checks are C-level scans; skip each regex pass when it can't match
+    if "=== PAGE " in text:
+        text = _PAGE_SEPARATOR_RE.sub("", text)
+    if "Page" in text:
+        text = _PAGE_FOOTER_RE.sub("", text)
 
     lines = text.split("\n")
-    sections: list[tuple[str, int]] = []
+    # Offset of each line's first character, for mapping match offsets to lines
+    line_starts = list(accumulate((len(line) + 1 for line in lines[:-1]), initial=0))
 
-    for i, line in enumerate(lines):
-        stripped = line.strip()
-        if not stripped:
-            continue
-        for section_name, pattern in SECTION_PATTERNS:
-            if re.match(pattern, stripped):
-                sections.append((section_name, i))
-                logger.info(f"Detected section '{section_name}' at line {i}: '{stripped}'")
-                break
+    sections = [
+        (m.lastgroup, bisect_right(line_starts, m.start()) - 1) for m in _SECTION_RE.finditer(text)
+    ]
+    logger.debug("Detected %d section headings: %s", len(sections), sections)
 
     result: dict[str, str] = {}
 
@@ -62,15 +116,25 @@ def detect_sections(text: str) -> dict[str, str]:
         result["header"] = text.strip()
         return result
 
+    # (name, content_start, content_end) per heading, computed once for both layouts;
+    # the heading itself sits on line content_start - 1
+    boundaries: list[tuple[str, int, int]] = [
+        (name, line_num + 1, sections[i + 1][1] if i + 1 < len(sections) else len(lines))
+        for i, (name, line_num) in enumerate(sections)
+    ]
+    first_index: dict[str, int] = {}
+    for i, (name, _, _) in enumerate(boundaries):
+        first_index.setdefault(name, i)
+
     # Check if this is a two-column (sidebar-interleaved) format
     # Indicator: sidebar sections appear BEFORE the main "experience" section
     # and very close to each other (within a few lines)
-    is_two_column = _detect_two_column(sections)
+    is_two_column = _detect_two_column(boundaries, first_index)
 
     if is_two_column:
-        result = _parse_two_column(lines, sections)
+        result = _parse_two_column(lines, boundaries, first_index)
     else:
-        result = _parse_single_column(lines, sections)
+        result = _parse_single_column(lines, boundaries)
 
     # Merge "earlier_experience" into "experience"
     if "earlier_experience" in result:
@@ -80,34 +144,38 @@ def detect_sections(text: str) -> dict[str, str]:
             result["experience"] = result["earlier_experience"]
         del result["earlier_experience"]
 
-    logger.info(f"Detected {len(result)} sections: {list(result.keys())}")
+    logger.info("Detected %d sections: %s", len(result), list(result))
     return result
 
 
-def _detect_two_column(sections: list[tuple[str, int]]) -> bool:
-    """Detect two-column layout: sidebar sections intermixed with summary before experience."""
-    exp_line = None
-    sidebar_before_exp = 0
+def _section_text(lines: list[str], start: int, end: int) -> str:
+    """Same result as "\n".join(lines[start:end]).strip(), skipping edge blank lines by index."""
+    while start < end and not lines[start].strip():
+        start += 1
+    while end > start and not lines[end - 1].strip():
+        end -= 1
+    if start == end:
+        return ""
+    if end - start == 1:
+        return lines[start].strip()
+    return "\n".join(lines[start:end]).strip()
 
-    for name, line_num in sections:
-        if name == "experience":
-            exp_line = line_num
-            break
 
-    if exp_line is None:
+def _detect_two_column(boundaries: list[tuple[str, int, int]], first_index: dict[str, int]) -> bool:
+    """Detect two-column layout: sidebar sections intermixed with summary before experience."""
+    exp_idx = first_index.get("experience")
+    if exp_idx is None:
         return False
 
-    for name, line_num in sections:
-        if line_num >= exp_line:
-            break
-        if name in SIDEBAR_SECTIONS:
-            sidebar_before_exp += 1
+    sidebar_before_exp = sum(1 for name, _, _ in boundaries[:exp_idx] if name in SIDEBAR_SECTIONS)
 
     # If multiple sidebar sections appear before experience, it's two-column
     return sidebar_before_exp >= 2
 
 
-def _parse_two_column(lines: list[str], sections: list[tuple[str, int]]) -> dict[str, str]:
+def _parse_two_column(
+    lines: list[str], boundaries: list[tuple[str, int, int]], first_index: dict[str, int]
+) -> dict[str, str]:
     """
     Parse two-column LinkedIn PDF where sidebar is interleaved with main content.
 
@@ -130,32 +198,22 @@ def _parse_two_column(lines: list[str], sections: list[tuple[str, int]]) -> dict
     """
     result: dict[str, str] = {}
 
-    # Find the "experience" section
-    exp_idx = None
-    for i, (name, line_num) in enumerate(sections):
-        if name == "experience":
-            exp_idx = i
-            break
+    exp_idx = first_index.get("experience")
 
     # Header
-    header_lines = lines[: sections[0][1]]
-    result["header"] = "\n".join(header_lines).strip()
+    result["header"] = _section_text(lines, 0, boundaries[0][1] - 1)
 
     if exp_idx is None:
-        return _parse_single_column(lines, sections)
+        return _parse_single_column(lines, boundaries)
 
-    pre_exp_sections = sections[:exp_idx]
-    exp_line = sections[exp_idx][1]
+    pre_exp_sections = [(name, start - 1) for name, start, _ in boundaries[:exp_idx]]
+    exp_line = boundaries[exp_idx][1] - 1
 
     # Identify sidebar section headings (everything except "summary")
-    sidebar_heading_lines: set[int] = set()
-    summary_heading_line = None
-
-    for name, line_num in pre_exp_sections:
-        if name == "summary":
-            summary_heading_line = line_num
-        else:
-            sidebar_heading_lines.add(line_num)
+    sidebar_heading_lines = frozenset(line_num for name, line_num in pre_exp_sections if name != "summary")
+    summary_heading_line = next(
+        (line_num for name, line_num in reversed(pre_exp_sections) if name == "summary"), None
+    )
 
     # In two-column format, sidebar content is interleaved with main summary text.
     # Strategy: collect ALL text between section headings, then separate sidebar
@@ -169,68 +227,41 @@ def _parse_two_column(lines: list[str], sections: list[tuple[str, int]]) -> dict
     # - "patents": short patent titles
     # - "publications": short publication titles
 
-    sidebar_headings_sorted = sorted(sidebar_heading_lines)
     all_sidebar_items: dict[str, list[str]] = {}
     all_sidebar_item_texts: set[str] = set()
-
-    # First pass: identify sidebar items by finding lines immediately after
-    # each sidebar heading that match expected content patterns
-    for sh_idx, sh_line in enumerate(sidebar_headings_sorted):
-        sec_name = None
-        for name, line_num in pre_exp_sections:
-            if line_num == sh_line:
-                sec_name = name
-                break
-        if not sec_name:
+    heading_names = {line_num: name for name, line_num in pre_exp_sections}
+
+    # Single pass from the first sidebar heading to experience. Each heading opens
+    # a window of up to SIDEBAR_WINDOW lines that ends at the next sidebar heading
+    # or once SIDEBAR_MAX_ITEMS items are collected.
+    cur_name: str | None = None
+    cur_line = 0
+    cur_items: list[str] = []
+    is_item = _is_short_title
+    first_line = min(sidebar_heading_lines) if sidebar_heading_lines else exp_line
+
+    for ln in range(first_line, exp_line):
+        if ln in sidebar_heading_lines:
+            if cur_items:
+                all_sidebar_items[cur_name] = cur_items
+            cur_name = heading_names[ln]
+            cur_line = ln
+            cur_items = []
+            is_item = _SIDEBAR_CLASSIFIERS.get(cur_name, _is_short_title)
             continue
+        if cur_name is None or len(cur_items) >= SIDEBAR_MAX_ITEMS or ln - cur_line > SIDEBAR_WINDOW:
+            continue
+        stripped = lines[ln].strip()
+        if not stripped:
+            continue
+        if stripped[0] in "-•":
+            continue
+        if is_item(stripped):
+            cur_items.append(stripped)
+            all_sidebar_item_texts.add(stripped)
 
-        # Sidebar items appear interleaved with main content after each heading.
-        # Expected counts: Top Skills = 3, Languages = 1-3, Awards/Patents/Pubs = 1-3
-        max_items = 3 if sec_name == "skills" else 3
-        items: list[str] = []
-
-        for offset in range(1, 12):  # search up to 12 lines after heading
-            if len(items) >= max_items:
-                break
-            ln = sh_line + offset
-            if ln >= exp_line:
-                break
-            if ln in sidebar_heading_lines:
-                break
-            stripped = lines[ln].strip()
-            if not stripped:
-                continue
-
-            # Sidebar items characteristics:
-            # - Short (< 35 chars for skills, < 45 for others)
-            # - No bullets
-            # - For skills: 1-4 word phrases, Title Case
-            # - For languages: "Language (Proficiency)" pattern
-            # - For awards/patents/pubs: short titles
-            max_len = 30 if sec_name == "skills" else 45
-            is_sidebar = False
-
-            if len(stripped) < max_len and not stripped.startswith("-") and not stripped.startswith("•"):
-                if sec_name == "skills":
-                    # Skills are 1-4 word Title Case phrases
-                    words = stripped.split()
-                    if 1 <= len(words) <= 4 and stripped[0].isupper() and not stripped.endswith("."):
-                        is_sidebar = True
-                elif sec_name == "languages":
-                    # "English (Full Professional)" or just "English"
-                    if re.match(r"^[A-Z]\w+(?:\s*\([^)]+\))?\s*$", stripped):
-                        is_sidebar = True
-                else:
-                    # Awards, patents, publications: short titles
-                    if len(stripped) < 45 and stripped[0].isupper():
-                        is_sidebar = True
-
-            if is_sidebar:
-                items.append(stripped)
-                all_sidebar_item_texts.add(stripped)
-
-        if items:
-            all_sidebar_items[sec_name] = items
+    if cur_items:
+        all_sidebar_items[cur_name] = cur_items
 
     # Extract summary: all lines between summary heading and experience,
     # excluding sidebar headings and known sidebar items
@@ -253,34 +284,24 @@ def _parse_two_column(lines: list[str], sections: list[tuple[str, int]]) -> dict
         result[sec_name] = "\n".join(items)
 
     # Parse sections from "experience" onward normally (single-column)
-    post_exp_sections = sections[exp_idx:]
-    for idx, (name, line_num) in enumerate(post_exp_sections):
-        if idx + 1 < len(post_exp_sections):
-            end_line = post_exp_sections[idx + 1][1]
-        else:
-            end_line = len(lines)
-        content = "\n".join(lines[line_num + 1: end_line]).strip()
+    for name, start, end in boundaries[exp_idx:]:
+        content = _section_text(lines, start, end)
         if content:
             result[name] = content
 
     return result
 
 
-def _parse_single_column(lines: list[str], sections: list[tuple[str, int]]) -> dict[str, str]:
+def _parse_single_column(lines: list[str], boundaries: list[tuple[str, int, int]]) -> dict[str, str]:
     """Standard single-column section parsing."""
     result: dict[str, str] = {}
 
     # Header
-    header_lines = lines[: sections[0][1]]
-    result["header"] = "\n".join(header_lines).strip()
+    result["header"] = _section_text(lines, 0, boundaries[0][1] - 1)
 
     # Extract content between section headings
-    for idx, (name, line_num) in enumerate(sections):
-        if idx + 1 < len(sections):
-            end_line = sections[idx + 1][1]
-        else:
-            end_line = len(lines)
-        content = "\n".join(lines[line_num + 1: end_line]).strip()
+    for name, start, end in boundaries:
+        content = _section_text(lines, start, end)
         if content:
             result[name] = content
 
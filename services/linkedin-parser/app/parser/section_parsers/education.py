@@ -1,5 +1,7 @@
 import re
 import logging
+from bisect import bisect_right
+from itertools import accumulate
 
 from app.parser.models import EducationEntry
 
@@ -10,10 +12,30 @@ logger = logging.getLogger(__name__)
 # Madras, India Jan 1997 - Jan 2000
 
 DATE_RANGE_PATTERN = re.compile(
-    r"(\w{3,9}\s+\d{4})\s*[-–—]\s*(\w{3,9}\s+\d{4}|Present)",
+    r"(\w{3,9}+\s++\d{4})\s*+[-–—]\s*+(\w{3,9}+\s++\d{4}|Present)",
     re.IGNORECASE,
 )
-YEAR_RANGE_PATTERN = re.compile(r"(\d{4})\s*[-–—]\s*(\d{4}|Present)", re.IGNORECASE)
+YEAR_RANGE_PATTERN = re.compile(r"(\d{4})\s*+[-–—]\s*+(\d{4}|Present)", re.IGNORECASE)
+
+# Whole-section scanning forms of the two patterns above (whitespace may not cross
+# a newline), used to find the dated lines with one finditer call each
+DATE_RANGE_SCAN = re.compile(
+    r"(\w{3,9}+[^\S\n]++\d{4})[^\S\n]*+[-–—][^\S\n]*+(\w{3,9}+[^\S\n]++\d{4}|Present)",
+    re.IGNORECASE,
+)
+YEAR_RANGE_SCAN = re.compile(r"(\d{4})[^\S\n]*+[-–—][^\S\n]*+(\d{4}|Present)", re.IGNORECASE)
+
+# "Degree in Field, School, Campus" or "Degree, School"
+DEGREE_SCHOOL_PATTERN = re.compile(
+    r"((?:Master'?s?|Bachelor'?s?|Doctor\w*|PhD|MBA|B\.?\s*S\.?|M\.?\s*S\.?|B\.?\s*A\.?|M\.?\s*A\.?|Associate'?s?)"
+    r"(?:\s+(?:in|of)\s+[\w\s&]+)?)"
+    r",\s*(.+)",
+    re.IGNORECASE,
+)
+DEGREE_FIELD_PATTERN = re.compile(r"(.+?)\s+(?:in|of)\s+(.+)", re.IGNORECASE)
+# First letters of every DEGREE_SCHOOL_PATTERN alternative; lines starting with
+# anything else (or lacking the comma) can't match, so the regex is skipped
+DEGREE_INITIALS = frozenset("MBDPAmbdpa")
 
 
 def parse_education(text: str) -> list[EducationEntry]:
@@ -23,30 +45,35 @@ def parse_education(text: str) -> list[EducationEntry]:
 
     lines = text.split("\n")
 
-    # Find date-range lines to anchor each education entry
+    # Find date-range lines to anchor each education entry, keeping each match
+    line_starts = list(accumulate((len(line) + 1 for line in lines[:-1]), initial=0))
+    dated = {bisect_right(line_starts, m.start()) - 1 for m in DATE_RANGE_SCAN.finditer(text)}
+    dated.update(bisect_right(line_starts, m.start()) - 1 for m in YEAR_RANGE_SCAN.finditer(text))
+
     date_line_indices = []
-    for i, line in enumerate(lines):
-        if DATE_RANGE_PATTERN.search(line) or YEAR_RANGE_PATTERN.search(line):
+    date_lines = []  # (stripped line, match), parallel to date_line_indices
+    for i in sorted(dated):
+        stripped = lines[i].strip()
+        date_match = DATE_RANGE_PATTERN.search(stripped) or YEAR_RANGE_PATTERN.search(stripped)
+        if date_match:
             date_line_indices.append(i)
+            date_lines.append((stripped, date_match))
 
     if not date_line_indices:
         # Fallback: block-based
         return _fallback_parse(lines)
 
     for idx, date_line_idx in enumerate(date_line_indices):
-        date_line = lines[date_line_idx].strip()
-
         # Extract dates
-        date_match = DATE_RANGE_PATTERN.search(date_line)
-        if not date_match:
-            date_match = YEAR_RANGE_PATTERN.search(date_line)
+        date_line, date_match = date_lines[idx]
         start_date = date_match.group(1) if date_match else None
         end_date = date_match.group(2) if date_match else None
 
         # Location is the part before dates on the date line
         location = None
         if date_match:
-            loc_part = date_line[:date_match.start()].strip().rstrip(",").strip()
+            # date_line is already stripped, so only the right edge needs trimming
+            loc_part = date_line[:date_match.start()].rstrip().rstrip(",").rstrip()
             if loc_part:
                 location = loc_part
 
@@ -58,14 +85,10 @@ def parse_education(text: str) -> list[EducationEntry]:
         else:
             search_start = 0
 
-        degree_school_lines = []
-        for t in range(search_start, date_line_idx):
-            stripped = lines[t].strip()
-            if stripped:
-                degree_school_lines.append(stripped)
+        degree_school = " ".join(filter(None, map(str.strip, lines[search_start:date_line_idx])))
 
         # Parse "Master's in Computer Science & Engineering, Indian Institute of Technology, Madras"
-        degree, field, school = _parse_degree_school(" ".join(degree_school_lines))
+        degree, field, school = _parse_degree_school(degree_school)
 
         entries.append(EducationEntry(
             school=school,
@@ -76,7 +99,7 @@ def parse_education(text: str) -> list[EducationEntry]:
             end_date=end_date,
         ))
 
-    logger.info(f"Parsed {len(entries)} education entries")
+    logger.info("Parsed %d education entries", len(entries))
     return entries
 
 
@@ -87,20 +110,16 @@ def _parse_degree_school(text: str) -> tuple[str | None, str | None, str]:
 
     # Pattern: "Degree in Field, School, Campus" or "Degree, School"
     # Try to match "X's in Y, School" pattern
-    match = re.match(
-        r"((?:Master'?s?|Bachelor'?s?|Doctor\w*|PhD|MBA|B\.?\s*S\.?|M\.?\s*S\.?|B\.?\s*A\.?|M\.?\s*A\.?|Associate'?s?)"
-        r"(?:\s+(?:in|of)\s+[\w\s&]+)?)"
-        r",\s*(.+)",
-        text,
-        re.IGNORECASE,
-    )
+    match = None
+    if text[0] in DEGREE_INITIALS and "," in text:
+        match = DEGREE_SCHOOL_PATTERN.match(text)
 
     if match:
         degree_part = match.group(1).strip()
         school = match.group(2).strip()
 
         # Split degree into degree + field
-        field_match = re.match(r"(.+?)\s+(?:in|of)\s+(.+)", degree_part, re.IGNORECASE)
+        field_match = DEGREE_FIELD_PATTERN.match(degree_part)
         if field_match:
             degree = field_match.group(1).strip()
             field = field_match.group(2).strip()
@@ -1,5 +1,7 @@
 import re
 import logging
+from bisect import bisect_right
+from itertools import accumulate
 
 from app.parser.models import ExperienceEntry
 
@@ -7,84 +9,159 @@ logger = logging.getLogger(__name__)
 
 # Date range pattern: "May 2025 - Present" or "October 2017 - October 2021 (4 years 1 month)"
 DATE_RANGE_PATTERN = re.compile(
-    r"(\w{3,9}\s+\d{4})\s*[-–—]\s*(Present|\w{3,9}\s+\d{4})",
+    r"(\w{3,9}+\s++\d{4})\s*+[-–—]\s*+(Present|\w{3,9}+\s++\d{4})",
     re.IGNORECASE,
 )
 
 # Year-only date pattern for "Earlier Experience": "2000 - 2014 (14 years)"
 YEAR_RANGE_PATTERN = re.compile(
-    r"^(\d{4})\s*[-–—]\s*(\d{4}|Present)\s*(?:\(.+?\))?\s*$",
+    r"^(\d{4})\s*+[-–—]\s*+(\d{4}|Present)\s*+(?:\(.+?\))?\s*$",
     re.IGNORECASE,
 )
 
+# Whole-section scanning forms of the two patterns above, for finding dated lines
+# with one finditer call; whitespace may not cross a newline so no match spans lines
+DATE_RANGE_SCAN = re.compile(
+    r"(\w{3,9}+[^\S\n]++\d{4})[^\S\n]*+[-–—][^\S\n]*+(Present|\w{3,9}+[^\S\n]++\d{4})",
+    re.IGNORECASE,
+)
+YEAR_RANGE_SCAN = re.compile(
+    r"^(\d{4})[^\S\n]*+[-–—][^\S\n]*+(\d{4}|Present)[^\S\n]*+(?:\(.+?\))?[^\S\n]*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+
 # Duration in parentheses: "(3 years 3 months)" or "(14 years)"
 DURATION_PATTERN = re.compile(r"\([\d]+\s+years?\s*(?:\d+\s+months?)?\)")
 
 # Page markers
 PAGE_MARKER = re.compile(r"^Page\s+\d+\s+of\s+\d+\s*$", re.IGNORECASE)
 
+# Sub-headings that get merged into the experience section
+MERGED_SECTION_HEADERS = frozenset({
+    "earlier experience", "additional experience", "other experience",
+    "previous experience", "prior experience",
+})
+
+# Action verbs that open description lines, never company names
+DESCRIPTION_STARTERS = frozenset({
+    "led", "built", "managed", "delivered", "achieved", "reduced",
+    "increased", "implemented", "designed", "developed", "created",
+    "launched", "scaled", "established", "generated", "enabled",
+    "optimized", "automated", "improved", "drove", "hired", "owned",
+})
+
+# Location lines: "Bengaluru", "Seattle, WA", "Greater Bengaluru Area"
+LOCATION_PATTERN = re.compile(
+    r"^[A-Z][a-z]+(?:\s[A-Z][a-z]+)*(?:,\s*\w+)*$"
+    r"|(?:Greater|Metro)\s+\w+"
+    r"|\b(?:Area|Region|Metro)\b"
+)
+
 
 def parse_experience(text: str) -> list[ExperienceEntry]:
     entries: list[ExperienceEntry] = []
     if not text.strip():
         return entries
 
-    # Remove page markers
-    lines = [l for l in text.split("\n") if not PAGE_MARKER.match(l.strip())]
+    # Strip once and remove page markers
+    lines = [l for l in (raw.strip() for raw in text.split("\n")) if not _is_page_marker(l)]
+    # Date/year-range matches per line (and the indices of dated lines), shared by
+    # format detection and both parsers
+    dates, dated = _classify_lines(lines)
 
     # Detect format by checking if company names appear on their own line before title
     # Format A (old LinkedIn): "Title\nCompany, Location DateRange\n• bullets"
     # Format B (new LinkedIn): "Company\nTitle\nDateRange (duration)\nLocation\n- bullets"
-    format_b = _detect_format_b(lines)
+    format_b = _detect_format_b(lines, dates, dated)
 
     if format_b:
-        entries = _parse_format_b(lines)
+        entries = _parse_format_b(lines, dates, dated)
     else:
-        entries = _parse_format_a(lines)
+        entries = _parse_format_a(lines, dates, dated)
 
-    logger.info(f"Parsed {len(entries)} experience entries (format={'B' if format_b else 'A'})")
+    logger.info("Parsed %d experience entries (format=%s)", len(entries), "B" if format_b else "A")
     return entries
 
 
-def _detect_format_b(lines: list[str]) -> bool:
+def _is_page_marker(line: str) -> bool:
+    """PAGE_MARKER.match on a stripped line, behind cheap prefix/suffix checks so
+    ordinary lines never reach the regex."""
+    return line[-1:].isdigit() and line[:4].lower() == "page" and PAGE_MARKER.match(line) is not None
+
+
+def _classify_lines(lines: list[str]) -> tuple[list[tuple[re.Match | None, re.Match | None]], list[int]]:
+    """(DATE_RANGE_PATTERN search, YEAR_RANGE_PATTERN match) for each stripped line,
+    plus the sorted indices of lines with either match.
+
+    The dated lines are found with one finditer pass per pattern over the joined
+    section; only those lines are matched individually.
+    """
+    text = "\n".join(lines)
+    line_starts = list(accumulate((len(line) + 1 for line in lines[:-1]), initial=0))
+    dated = {bisect_right(line_starts, m.start()) - 1 for m in DATE_RANGE_SCAN.finditer(text)}
+    dated.update(bisect_right(line_starts, m.start()) - 1 for m in YEAR_RANGE_SCAN.finditer(text))
+
+    dates: list[tuple[re.Match | None, re.Match | None]] = [(None, None)] * len(lines)
+    for i in dated:
+        dates[i] = (DATE_RANGE_PATTERN.search(lines[i]), YEAR_RANGE_PATTERN.match(lines[i]))
+    return dates, sorted(dated)
+
+
+def _strip_date_ranges(line: str, first: re.Match) -> str:
+    """DATE_RANGE_PATTERN.sub("", line) given the first match: slice it out and only
+    rescan the tail after it."""
+    tail = line[first.end():]
+    if tail:
+        tail = DATE_RANGE_PATTERN.sub("", tail)
+    return line[:first.start()] + tail
+
+
+def _detect_format_b(
+    lines: list[str], dates: list[tuple[re.Match | None, re.Match | None]], dated: list[int]
+) -> bool:
     """Detect if experience uses Format B (Company on own line, date on separate line with duration)."""
-    for i, line in enumerate(lines):
-        stripped = line.strip()
+    # Only dated lines can signal either format, so undated lines are never visited
+    for i in dated:
+        stripped = lines[i]
+        date_match, year_match = dates[i]
         # Format B: date line has duration in parens and is a standalone line
-        if DATE_RANGE_PATTERN.search(stripped) and DURATION_PATTERN.search(stripped):
+        if date_match and DURATION_PATTERN.search(stripped):
             # In Format B, the date line only contains the date range + duration
-            cleaned = DATE_RANGE_PATTERN.sub("", stripped)
+            cleaned = _strip_date_ranges(stripped, date_match)
             cleaned = DURATION_PATTERN.sub("", cleaned).strip()
             if not cleaned or len(cleaned) < 3:
                 return True
-        if YEAR_RANGE_PATTERN.match(stripped):
+        if year_match:
             return True
     return False
 
 
-def _parse_format_b(lines: list[str]) -> list[ExperienceEntry]:
+def _parse_format_b(
+    lines: list[str], dates: list[tuple[re.Match | None, re.Match | None]], dated: list[int]
+) -> list[ExperienceEntry]:
     """Parse Format B: Company\\nTitle\\nDateRange (duration)\\nLocation\\n- bullets"""
     entries: list[ExperienceEntry] = []
 
     # Find date-range lines (these anchor each role)
-    date_line_indices = []
-    for i, line in enumerate(lines):
-        stripped = line.strip()
-        if DATE_RANGE_PATTERN.search(stripped) or YEAR_RANGE_PATTERN.match(stripped):
-            date_line_indices.append(i)
+    date_line_indices = dated
 
     if not date_line_indices:
         return _fallback_parse(lines)
 
+    # Whether the line 2 above each anchor looks like a company name. Each of these
+    # lines is both a company candidate for its own role and the possible end of
+    # the previous role's description, so evaluate it once.
+    company_like = [
+        i >= 2 and _looks_like_company(lines[i - 2], dated=any(dates[i - 2]))
+        for i in date_line_indices
+    ]
+
     # Track the current company name (persists for multiple roles at same company)
     current_company = None
 
     for idx, date_line_idx in enumerate(date_line_indices):
-        date_line = lines[date_line_idx].strip()
-
         # Parse dates
-        date_match = DATE_RANGE_PATTERN.search(date_line)
-        year_match = YEAR_RANGE_PATTERN.match(date_line)
+        date_match, year_match = dates[date_line_idx]
         if date_match:
             start_date = date_match.group(1)
             end_date = date_match.group(2)
@@ -96,36 +173,12 @@ def _parse_format_b(lines: list[str]) -> list[ExperienceEntry]:
             end_date = None
 
         # Title is 1 line above date
-        title = lines[date_line_idx - 1].strip() if date_line_idx > 0 else "Unknown Role"
+        title = lines[date_line_idx - 1] if date_line_idx > 0 else "Unknown Role"
 
         # Company: 2 lines above date, OR carried forward from previous entry
-        # We need to check if the line 2-above is a company name or description text
-        company_candidate = None
-        if date_line_idx >= 2:
-            candidate = lines[date_line_idx - 2].strip()
-            # A company name is typically short, no bullets, not a description
-            if (candidate
-                    and not candidate.startswith("-")
-                    and not candidate.startswith("•")
-                    and len(candidate) < 80
-                    and not DATE_RANGE_PATTERN.search(candidate)
-                    and not YEAR_RANGE_PATTERN.match(candidate)
-                    and not DURATION_PATTERN.search(candidate)):
-                # Check if this is a new company or just a continuation of description
-                # If prev entry exists and this candidate isn't after a blank line, it might be description
-                if idx > 0:
-                    prev_date_idx = date_line_indices[idx - 1]
-                    # Lines between prev date line and this company candidate
-                    between_start = prev_date_idx + 1
-                    between_end = date_line_idx - 2
-                    # Check if there's content between (descriptions) — if the candidate is
-                    # immediately after descriptions without a gap, check if it looks like a company
-                    if _looks_like_company(candidate):
-                        company_candidate = candidate
-                else:
-                    # First entry — line 2-above should be company
-                    company_candidate = candidate
-
+        company_candidate = _company_candidate(
+            lines, dates, date_line_idx, first_entry=idx == 0, company_like=company_like[idx]
+        )
         if company_candidate:
             current_company = company_candidate
         company = current_company or ""
@@ -133,7 +186,7 @@ def _parse_format_b(lines: list[str]) -> list[ExperienceEntry]:
         # Location: 1 line below date (if it looks like a location)
         location = None
         if date_line_idx + 1 < len(lines):
-            loc_candidate = lines[date_line_idx + 1].strip()
+            loc_candidate = lines[date_line_idx + 1]
             if _looks_like_location(loc_candidate):
                 location = loc_candidate
                 desc_start = date_line_idx + 2
@@ -148,18 +201,13 @@ def _parse_format_b(lines: list[str]) -> list[ExperienceEntry]:
             # Description ends 2 lines before next date (title line and maybe company line)
             desc_end = next_date_idx - 1  # at minimum, the title line
             # Check if line at next_date_idx - 2 is a company name
-            if next_date_idx >= 2 and _looks_like_company(lines[next_date_idx - 2].strip()):
+            if company_like[idx + 1]:
                 desc_end = next_date_idx - 2
         else:
             desc_end = len(lines)
 
-        desc_lines = []
-        for d in range(desc_start, desc_end):
-            stripped = lines[d].strip()
-            if stripped:
-                desc_lines.append(stripped)
-
-        description = "\n".join(desc_lines) if desc_lines else None
+        # Lines are already stripped; blanks are dropped and an empty result means None
+        description = "\n".join(filter(None, lines[desc_start:desc_end])) or None
 
         entries.append(ExperienceEntry(
             title=title,
@@ -173,32 +221,57 @@ def _parse_format_b(lines: list[str]) -> list[ExperienceEntry]:
     return entries
 
 
-def _looks_like_company(text: str) -> bool:
-    """Heuristic: is this line likely a company name?"""
-    if not text:
+def _company_candidate(
+    lines: list[str],
+    dates: list[tuple[re.Match | None, re.Match | None]],
+    date_line_idx: int,
+    first_entry: bool,
+    company_like: bool,
+) -> str | None:
+    """Company name from the line 2 above a Format B date line, if it is one.
+
+    ``company_like`` is _looks_like_company() for that line, precomputed by the caller.
+    """
+    if date_line_idx < 2:
+        return None
+    # We need to check if the line 2-above is a company name or description text
+    candidate = lines[date_line_idx - 2]
+    # A company name is typically short, no bullets, not a description
+    if (not candidate
+            or candidate[0] in "-•"
+            or len(candidate) >= 80
+            or any(dates[date_line_idx - 2])
+            or DURATION_PATTERN.search(candidate)):
+        return None
+    # First entry — line 2-above should be company. Later entries may have
+    # description text running straight into the next role, so require the
+    # candidate to look like a company.
+    if first_entry or company_like:
+        return candidate
+    return None
+
+
+def _looks_like_company(text: str, dated: bool) -> bool:
+    """Heuristic: is this (stripped) line likely a company name?
+
+    ``dated`` is whether the line matched a date/year range, as already computed
+    by _classify_lines.
+    """
+    if not text or dated:
         return False
     # Company names: short, no bullets, no dates, typically Title Case or known patterns
-    if text.startswith("-") or text.startswith("•"):
-        return False
-    if DATE_RANGE_PATTERN.search(text) or YEAR_RANGE_PATTERN.match(text):
+    if text[0] in "-•" or len(text) > 60:
         return False
-    if len(text) > 60:
+    # Company names are usually short (1-5 words) and don't start with lowercase.
+    # Nine pieces are enough to tell "more than 8 words" apart.
+    words = text.split(None, 8)
+    if len(words) > 8:
         return False
     # Skip section headers that got merged into experience
-    section_headers = {"earlier experience", "additional experience", "other experience",
-                       "previous experience", "prior experience"}
-    if text.lower().strip() in section_headers:
-        return False
-    # Company names are usually short (1-5 words) and don't start with lowercase
-    words = text.split()
-    if len(words) > 8:
+    if text.lower() in MERGED_SECTION_HEADERS:
         return False
     # Avoid description-like lines that start with action verbs
-    desc_starters = {"led", "built", "managed", "delivered", "achieved", "reduced",
-                     "increased", "implemented", "designed", "developed", "created",
-                     "launched", "scaled", "established", "generated", "enabled",
-                     "optimized", "automated", "improved", "drove", "hired", "owned"}
-    if words and words[0].lower().rstrip(",.:") in desc_starters:
+    if words[0].lower().rstrip(",.:") in DESCRIPTION_STARTERS:
         return False
     return True
 
@@ -207,34 +280,23 @@ def _looks_like_location(text: str) -> bool:
     """Heuristic: is this line a location?"""
     if not text:
         return False
-    if text.startswith("-") or text.startswith("•"):
-        return False
-    if len(text) > 60:
+    if text[0] in "-•" or len(text) > 60:
         return False
-    # Location patterns: "City", "City, State", "Greater City Area"
-    location_patterns = [
-        r"^[A-Z][a-z]+(?:\s[A-Z][a-z]+)*(?:,\s*\w+)*$",  # "Bengaluru" or "Seattle, WA"
-        r"(?:Greater|Metro)\s+\w+",  # "Greater Bengaluru Area"
-        r"\b(?:Area|Region|Metro)\b",
-    ]
-    for pat in location_patterns:
-        if re.search(pat, text):
-            return True
-    # Short text with comma (City, State/Country pattern)
+    # Short text with comma (City, State/Country pattern) — checked before the regex
     if "," in text and len(text) < 40:
         return True
-    return False
+    # Location patterns: "City", "City, State", "Greater City Area"
+    return LOCATION_PATTERN.search(text) is not None
 
 
-def _parse_format_a(lines: list[str]) -> list[ExperienceEntry]:
+def _parse_format_a(
+    lines: list[str], dates: list[tuple[re.Match | None, re.Match | None]], dated: list[int]
+) -> list[ExperienceEntry]:
     """Parse Format A (original LinkedIn): Title\\nCompany, Location DateRange\\n• bullets"""
     entries: list[ExperienceEntry] = []
 
     # Find date-range lines
-    date_line_indices = []
-    for i, line in enumerate(lines):
-        if DATE_RANGE_PATTERN.search(line):
-            date_line_indices.append(i)
+    date_line_indices = [i for i in dated if dates[i][0]]
 
     if not date_line_indices:
         return _fallback_parse(lines)
@@ -248,7 +310,7 @@ def _parse_format_a(lines: list[str]) -> list[ExperienceEntry]:
 
         title_lines = []
         for t in range(date_line_idx - 1, min_title_start - 1, -1):
-            stripped = lines[t].strip()
+            stripped = lines[t]
             if stripped and not stripped.startswith("•") and not stripped.startswith("-"):
                 title_lines.insert(0, stripped)
                 break
@@ -256,12 +318,12 @@ def _parse_format_a(lines: list[str]) -> list[ExperienceEntry]:
         title = " ".join(title_lines) if title_lines else "Unknown Role"
 
         # Parse the date line
-        date_line = lines[date_line_idx].strip()
-        date_match = DATE_RANGE_PATTERN.search(date_line)
+        date_line = lines[date_line_idx]
+        date_match = dates[date_line_idx][0]
         start_date = date_match.group(1) if date_match else None
         end_date = date_match.group(2) if date_match else None
 
-        company_location = DATE_RANGE_PATTERN.sub("", date_line).strip().rstrip(",").strip()
+        company_location = _strip_date_ranges(date_line, date_match).strip().rstrip(",").rstrip()
         company, location = _split_company_location(company_location)
 
         # Description
@@ -271,13 +333,7 @@ def _parse_format_a(lines: list[str]) -> list[ExperienceEntry]:
         else:
             desc_end = len(lines)
 
-        desc_lines = []
-        for d in range(date_line_idx + 1, desc_end):
-            stripped = lines[d].strip()
-            if stripped:
-                desc_lines.append(stripped)
-
-        description = "\n".join(desc_lines) if desc_lines else None
+        description = "\n".join(filter(None, lines[date_line_idx + 1:desc_end])) or None
 
         entries.append(ExperienceEntry(
             title=title,
@@ -11,6 +11,12 @@ from app.parser.models import (
     CourseEntry,
 )
 
+YEAR_PATTERN = re.compile(r"\d{4}")
+LANGUAGE_PATTERN = re.compile(r"(.+?)\s*[·(]\s*(.+?)\s*\)?$")
+PATENT_NUMBER_PATTERN = re.compile(r"(?:patent|pat\.?\s*(?:no|#|number))\s*[:.]?\s*\w+", re.IGNORECASE)
+# One or more whitespace-only lines between blocks
+BLOCK_SEPARATOR = re.compile(r"\n\s*\n")
+
 
 def parse_certifications(text: str) -> list[CertificationEntry]:
     entries = []
@@ -20,7 +26,7 @@ def parse_certifications(text: str) -> list[CertificationEntry]:
         authority = None
         date = None
         for line in block[1:]:
-            if re.search(r"\d{4}", line):
+            if YEAR_PATTERN.search(line):
                 date = line.strip()
             elif not authority:
                 authority = line.strip()
@@ -35,7 +41,7 @@ def parse_languages(text: str) -> list[LanguageEntry]:
         if not stripped:
             continue
         # Pattern: "English (Native or Bilingual)" or "Spanish · Professional"
-        match = re.match(r"(.+?)\s*[·(]\s*(.+?)\s*\)?$", stripped)
+        match = LANGUAGE_PATTERN.match(stripped)
         if match:
             entries.append(LanguageEntry(language=match.group(1).strip(), proficiency=match.group(2).strip()))
         else:
@@ -86,9 +92,9 @@ def parse_patents(text: str) -> list[PatentEntry]:
         date = None
         desc_lines = []
         for line in block[1:]:
-            if re.search(r"(?:patent|pat\.?\s*(?:no|#|number))\s*[:.]?\s*\w+", line, re.IGNORECASE):
+            if PATENT_NUMBER_PATTERN.search(line):
                 patent_number = line.strip()
-            elif re.search(r"\d{4}", line) and not date:
+            elif YEAR_PATTERN.search(line) and not date:
                 date = line.strip()
             else:
                 desc_lines.append(line)
@@ -112,7 +118,7 @@ def parse_awards(text: str) -> list[AwardEntry]:
         date = None
         desc_lines = []
         for line in block[1:]:
-            if re.search(r"\d{4}", line) and not date:
+            if YEAR_PATTERN.search(line) and not date:
                 date = line.strip()
             elif not issuer:
                 issuer = line.strip()
@@ -154,17 +160,10 @@ def parse_courses(text: str) -> list[CourseEntry]:
 
 
 def _split_blocks(text: str) -> list[list[str]]:
-    lines = text.split("\n")
-    blocks: list[list[str]] = []
-    current: list[str] = []
-    for line in lines:
-        stripped = line.strip()
-        if not stripped:
-            if current:
-                blocks.append(current)
-                current = []
-            continue
-        current.append(stripped)
-    if current:
-        blocks.append(current)
+    """Stripped non-blank lines of each blank-line-separated block."""
+    blocks = []
+    for chunk in BLOCK_SEPARATOR.split(text):
+        block = [stripped for stripped in (line.strip() for line in chunk.split("\n")) if stripped]
+        if block:
+            blocks.append(block)
     return blocks
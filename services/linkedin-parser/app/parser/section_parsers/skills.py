@@ -19,13 +19,21 @@ logger = logging.getLogger(__name__)
 
 CATEGORY_PATTERN = re.compile(r"^(.+?)\s*:\s*$")
 
+# Endorsement counts: "Python · 12 endorsements" / "Python (12)"
+ENDORSEMENT_DOT_PATTERN = re.compile(r"\s*·\s*\d+\s*(?:endorsements?)?", re.IGNORECASE)
+ENDORSEMENT_PAREN_PATTERN = re.compile(r"\s*\(\d+\s*(?:endorsements?)?\)", re.IGNORECASE)
+
+LANGUAGE_PAREN_PATTERN = re.compile(r"(.+?)\s*\((.+?)\)")
+LANGUAGE_DOT_PATTERN = re.compile(r"(.+?)\s*·\s*(.+)")
+
 
 def parse_skills(text: str) -> tuple[list[str], list[SkillCategory], list[LanguageEntry]]:
     """Parse skills section. Returns (flat_skills, skill_categories, languages)."""
     if not text.strip():
         return ([], [], [])
 
-    lines = text.split("\n")
+    # Stripped, non-blank lines, shared by the category pass and the flat fallback
+    lines = [stripped for stripped in (line.strip() for line in text.split("\n")) if stripped]
     categories: list[SkillCategory] = []
     languages: list[LanguageEntry] = []
     all_skills: list[str] = []
@@ -33,11 +41,7 @@ def parse_skills(text: str) -> tuple[list[str], list[SkillCategory], list[Langua
     current_category: str | None = None
     current_skills: list[str] = []
 
-    for line in lines:
-        stripped = line.strip()
-        if not stripped:
-            continue
-
+    for stripped in lines:
         # Check if this is a category header like "Top Skills :"
         cat_match = CATEGORY_PATTERN.match(stripped)
         if cat_match:
@@ -81,12 +85,12 @@ def parse_skills(text: str) -> tuple[list[str], list[SkillCategory], list[Langua
 
     # If no categories detected, treat all as flat skills
     if not categories and not languages:
-        for line in lines:
-            stripped = line.strip()
-            if stripped:
-                all_skills.extend(_extract_skills_from_line(stripped))
+        for stripped in lines:
+            all_skills.extend(_extract_skills_from_line(stripped))
 
-    logger.info(f"Parsed {len(all_skills)} skills in {len(categories)} categories, {len(languages)} languages")
+    logger.info(
+        "Parsed %d skills in %d categories, %d languages", len(all_skills), len(categories), len(languages)
+    )
     return (all_skills, categories, languages)
 
 
@@ -94,8 +98,8 @@ def _extract_skills_from_line(line: str) -> list[str]:
     """Split comma-separated skills from a line."""
     skills = []
     # Remove endorsement counts
-    cleaned = re.sub(r"\s*·\s*\d+\s*(?:endorsements?)?", "", line, flags=re.IGNORECASE)
-    cleaned = re.sub(r"\s*\(\d+\s*(?:endorsements?)?\)", "", cleaned, flags=re.IGNORECASE)
+    cleaned = ENDORSEMENT_DOT_PATTERN.sub("", line)
+    cleaned = ENDORSEMENT_PAREN_PATTERN.sub("", cleaned)
 
     if "," in cleaned:
         for s in cleaned.split(","):
@@ -116,12 +120,12 @@ def _parse_language(text: str) -> LanguageEntry | None:
     if not text:
         return None
 
-    match = re.match(r"(.+?)\s*\((.+?)\)", text)
+    match = LANGUAGE_PAREN_PATTERN.match(text)
     if match:
         return LanguageEntry(language=match.group(1).strip(), proficiency=match.group(2).strip())
 
     # Try "Language · Proficiency" pattern
-    match = re.match(r"(.+?)\s*·\s*(.+)", text)
+    match = LANGUAGE_DOT_PATTERN.match(text)
     if match:
         return LanguageEntry(language=match.group(1).strip(), proficiency=match.group(2).strip())
 
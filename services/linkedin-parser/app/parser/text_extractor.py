@@ -1,24 +1,84 @@
 import io
 import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 import pdfplumber
 import fitz  # PyMuPDF
 
 logger = logging.getLogger(__name__)
 
+# pdfplumber layout reconstruction is pure Python and holds the GIL, so longer
+# documents are split into contiguous page ranges extracted in worker processes.
+# Each worker keeps its own pdfplumber import resident, so the pool is capped
+# well below the core count; affinity reflects the container's CPU set.
+PARALLEL_MIN_PAGES = 4
+MAX_EXTRACT_WORKERS = 4
+EXTRACT_WORKERS = min(
+    MAX_EXTRACT_WORKERS,
+    len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1,
+)
+
+_process_pool: ProcessPoolExecutor | None = None
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    global _process_pool
+    if _process_pool is None:
+        # spawn: forking a threaded server process is not safe
+        _process_pool = ProcessPoolExecutor(
+            max_workers=EXTRACT_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _process_pool
+
+
+def shutdown_process_pool() -> None:
+    """Stop the extraction workers; called from the app lifespan on shutdown."""
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+
+
+def _pdfplumber_page_range(pdf_bytes: bytes, start: int, stop: int) -> list[str]:
+    """Worker: non-empty page texts for pages[start:stop]."""
+    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+        return [text for page in pdf.pages[start:stop] if (text := page.extract_text())]
+
+
+def _pdfplumber_parallel(pdf_bytes: bytes, page_count: int) -> list[str]:
+    workers = min(EXTRACT_WORKERS, page_count)
+    step = -(-page_count // workers)  # ceil division
+    try:
+        pool = _get_process_pool()
+        futures = [
+            pool.submit(_pdfplumber_page_range, pdf_bytes, start, start + step)
+            for start in range(0, page_count, step)
+        ]
+        # Futures are in page order, so the text is reassembled in order
+        return [text for future in futures for text in future.result()]
+    except BrokenProcessPool:
+        # A worker died (e.g. OOM on a malformed PDF), which breaks the pool for
+        # good; drop it so the next request starts a fresh one
+        shutdown_process_pool()
+        raise
+
 
 def extract_with_pdfplumber(pdf_bytes: bytes) -> str | None:
     try:
         with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
-            pages = []
-            for page in pdf.pages:
-                text = page.extract_text()
-                if text:
-                    pages.append(text)
+            page_count = len(pdf.pages)
+            if page_count >= PARALLEL_MIN_PAGES and EXTRACT_WORKERS > 1:
+                pages = _pdfplumber_parallel(pdf_bytes, page_count)
+            else:
+                pages = [text for page in pdf.pages if (text := page.extract_text())]
             if pages:
                 return "\n".join(pages)
     except Exception as e:
-        logger.warning(f"pdfplumber extraction failed: {e}")
+        logger.warning("pdfplumber extraction failed: %s", e)
     return None
 
 
@@ -34,16 +94,18 @@ def extract_with_pymupdf(pdf_bytes: bytes) -> str | None:
         if pages:
             return "\n".join(pages)
     except Exception as e:
-        logger.warning(f"PyMuPDF extraction failed: {e}")
+        logger.warning("PyMuPDF extraction failed: %s", e)
     return None
 
 
 def extract_text(pdf_bytes: bytes) -> str:
-    text = extract_with_pdfplumber(pdf_bytes)
+    # PyMuPDF is an order of magnitude faster on text-layer PDFs; pdfplumber is
+    # only worth its cost when PyMuPDF comes back (nearly) empty.
+    text = extract_with_pymupdf(pdf_bytes)
     if text and len(text.strip()) > 50:
         return text
 
-    text = extract_with_pymupdf(pdf_bytes)
+    text = extract_with_pdfplumber(pdf_bytes)
     if text and len(text.strip()) > 50:
         return text
 
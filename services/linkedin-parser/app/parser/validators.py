@@ -1,5 +1,9 @@
 import re
+import string
 import logging
+from datetime import datetime
+from functools import lru_cache
+from typing import Iterable
 
 from app.parser.models import ParsedProfile
 
@@ -14,73 +18,102 @@ logger = logging.getLogger(__name__)
 # bbala
 # Address: Bengaluru, Karnataka, India
 
-EMAIL_PATTERN = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+# The lookbehind only lets a match start at the beginning of a run of local-part
+# characters. search() finds the same leftmost match as without it, but no longer
+# rescans the run from every offset (quadratic on long unbroken tokens).
+EMAIL_PATTERN = re.compile(r"(?<![a-zA-Z0-9._%+-])[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
 PHONE_PATTERN = re.compile(r"\+?\d[\d\s\-\(\)]{7,15}\d")
 LINKEDIN_PATTERN = re.compile(r"(?:https?://)?(?:www\.)?linkedin\.com/in/[\w\-]+", re.IGNORECASE)
 WEBSITE_PATTERN = re.compile(r"https?://[\w\.\-]+\.\w{2,}[/\w\.\-]*", re.IGNORECASE)
 
-# Known label prefixes in LinkedIn PDF headers
-LABEL_PATTERNS = {
-    "email": re.compile(r"^(?:Email|E-mail)\s*:\s*(.+)", re.IGNORECASE),
-    "phone": re.compile(r"^(?:Mobile\s*(?:Number)?|Phone|Tel)\s*:\s*(.+)", re.IGNORECASE),
-    "address": re.compile(r"^Address\s*:\s*(.+)", re.IGNORECASE),
-    "linkedin": re.compile(r"LinkedIn\s*:\s*(https?://[\S]+)", re.IGNORECASE),
-    "web_link": re.compile(r"Web\s*Link\s*:\s*(https?://[\S]+)", re.IGNORECASE),
-}
+# Known label prefixes in LinkedIn PDF headers, as one alternation: the named
+# group that matched is the label kind and the value follows m.end()
+LABEL_PATTERN = re.compile(
+    r"^(?:(?P<email>Email|E-mail)"
+    r"|(?P<phone>Mobile\s*(?:Number)?|Phone|Tel)"
+    r"|(?P<address>Address)"
+    r"|(?P<linkedin>LinkedIn)"
+    r"|(?P<web_link>Web\s*Link))"
+    r"\s*:\s*",
+    re.IGNORECASE,
+)
+# LinkedIn / Web Link values must be URLs
+LABEL_URL_PATTERN = re.compile(r"https?://\S+", re.IGNORECASE)
+# Any label with a value, as found by search(): the URL labels may appear
+# mid-line (e.g. trailing a headline), the others only at the start
+LABEL_ANYWHERE_PATTERN = re.compile(
+    r"^(?:Email|E-mail|Mobile\s*(?:Number)?|Phone|Tel|Address)\s*:\s*."
+    r"|(?:LinkedIn|Web\s*Link)\s*:\s*https?://\S",
+    re.IGNORECASE,
+)
+
+# Cleanup / heuristic patterns used while walking header lines
+PHONE_TYPE_SUFFIX_PATTERN = re.compile(r"\s*\((?:Mobile|Home|Work)\)\s*$", re.IGNORECASE)
+LINKEDIN_URL_TRAIL_PATTERN = re.compile(r"linkedin\.com/in/\s*$", re.IGNORECASE)
+LINKEDIN_SUFFIX_PATTERN = re.compile(r"\s*\(LinkedIn\)\s*$", re.IGNORECASE)
+URL_SCHEME_PATTERN = re.compile(r"^https?://", re.IGNORECASE)
+LINKEDIN_REF_PATTERN = re.compile(r"^(\w[\w\-]+)\s*\(LinkedIn\)\s*$", re.IGNORECASE)
+# Characters a name line may consist of: ASCII letters, ".", "-", "'" and any
+# whitespace (every str.isspace() character, i.e. what \s matches)
+NAME_CHARS = frozenset(
+    string.ascii_letters + ".-'"
+    + "\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680\u2000\u2001\u2002\u2003\u2004"
+    "\u2005\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000"
+)
+CONTACT_PREFIX_PATTERN = re.compile(r"^Contact\s+", re.IGNORECASE)
+WEB_LINK_TAIL_PATTERN = re.compile(r"\s*Web\s*Link\s*:.*$", re.IGNORECASE)
+LINKEDIN_TAIL_PATTERN = re.compile(r"\s*LinkedIn\s*:.*$", re.IGNORECASE)
+PHONE_WITH_TYPE_PREFIX_PATTERN = re.compile(r"^\+?\d[\d\s\-\(\)]{7,15}\d\s*\((?:Mobile|Home|Work)\)\s*", re.IGNORECASE)
+CITY_REGION_PATTERN = re.compile(r",\s*\w{2,}")
+
+
+def _has_email(text: str) -> bool:
+    # Substring check first: most lines have no "@" and never reach the regex
+    return "@" in text and EMAIL_PATTERN.search(text) is not None
+
+
+def _has_url(text: str) -> bool:
+    return "://" in text and WEBSITE_PATTERN.search(text) is not None
 
 
 def extract_contact_from_header(header: str, profile: ParsedProfile) -> ParsedProfile:
     """Extract name, email, phone, location, LinkedIn URL, headline from header block."""
-    lines = header.split("\n")
-    non_empty = [l.strip() for l in lines if l.strip()]
+    # Stripped once here (one strip per line); every pass below works on these
+    # stripped lines, so they are kept as a list rather than streamed
+    non_empty = [l for l in map(str.strip, header.split("\n")) if l]
 
     # First pass: extract labeled fields
     consumed_indices: set[int] = set()
     linkedin_parts: list[str] = []
 
-    for i, line in enumerate(non_empty):
-        stripped = line.strip()
-
-        # Email: field
-        email_label = LABEL_PATTERNS["email"].match(stripped)
-        if email_label:
-            profile.email = email_label.group(1).strip()
-            consumed_indices.add(i)
-            continue
-
-        # Phone field
-        phone_label = LABEL_PATTERNS["phone"].match(stripped)
-        if phone_label:
-            phone_text = phone_label.group(1).strip()
-            # Clean "(Mobile)" suffix
-            phone_text = re.sub(r"\s*\((?:Mobile|Home|Work)\)\s*$", "", phone_text, flags=re.IGNORECASE)
-            profile.phone = phone_text.strip()
-            consumed_indices.add(i)
-            continue
-
-        # Address field
-        addr_label = LABEL_PATTERNS["address"].match(stripped)
-        if addr_label:
-            profile.location = addr_label.group(1).strip()
-            consumed_indices.add(i)
-            continue
-
-        # LinkedIn URL (may be split across lines due to PDF wrapping)
-        linkedin_label = LABEL_PATTERNS["linkedin"].match(stripped)
-        if linkedin_label:
-            linkedin_parts.append(linkedin_label.group(1))
-            consumed_indices.add(i)
-            continue
-
-        # Web Link
-        web_label = LABEL_PATTERNS["web_link"].match(stripped)
-        if web_label:
-            profile.website_url = web_label.group(1).strip()
-            consumed_indices.add(i)
-            continue
+    for i, stripped in enumerate(non_empty):
+        label = LABEL_PATTERN.match(stripped)
+        if label:
+            kind = label.lastgroup
+            value = stripped[label.end():]
+            if kind in ("linkedin", "web_link"):
+                url = LABEL_URL_PATTERN.match(value)
+                value = url.group() if url else ""
+
+            if value:
+                if kind == "email":
+                    profile.email = value.strip()
+                elif kind == "phone":
+                    # Clean "(Mobile)" suffix
+                    profile.phone = PHONE_TYPE_SUFFIX_PATTERN.sub("", value.strip()).strip()
+                elif kind == "address":
+                    profile.location = value.strip()
+                elif kind == "linkedin":
+                    # LinkedIn URL (may be split across lines due to PDF wrapping)
+                    linkedin_parts.append(value)
+                else:
+                    profile.website_url = value.strip()
+                consumed_indices.add(i)
+                continue
 
         # Inline email detection (email may appear on long lines mixed with other text)
-        if not profile.email:
+        # ("@" is checked first so most lines never reach the regex)
+        if not profile.email and "@" in stripped:
             email_match = EMAIL_PATTERN.search(stripped)
             if email_match:
                 profile.email = email_match.group()
@@ -94,76 +127,73 @@ def extract_contact_from_header(header: str, profile: ParsedProfile) -> ParsedPr
         url = linkedin_parts[0]
         profile.linkedin_url = url
     elif not profile.linkedin_url:
-        # Search full header for LinkedIn URL
-        full_header = " ".join(non_empty)
-        match = LINKEDIN_PATTERN.search(full_header)
+        # Search full header for LinkedIn URL. The pattern can't span whitespace,
+        # so the raw header finds the same match as the stripped lines would.
+        match = LINKEDIN_PATTERN.search(header)
         if match:
             profile.linkedin_url = match.group()
 
     # Fallback: look for "www.linkedin.com/in/" on one line and username on next
     if not profile.linkedin_url:
-        for i, line in enumerate(non_empty):
-            stripped = line.strip()
-            if re.search(r"linkedin\.com/in/\s*$", stripped, re.IGNORECASE):
+        for i, stripped in enumerate(non_empty):
+            if LINKEDIN_URL_TRAIL_PATTERN.search(stripped):
                 # URL continues on next line
                 if i + 1 < len(non_empty):
-                    next_line = non_empty[i + 1].strip()
+                    next_line = non_empty[i + 1]
                     # Next line might be "username (LinkedIn)" or just "username"
-                    username = re.sub(r"\s*\(LinkedIn\)\s*$", "", next_line, flags=re.IGNORECASE).strip()
+                    username = LINKEDIN_SUFFIX_PATTERN.sub("", next_line).strip()
                     if username and len(username) < 40 and " " not in username:
-                        base = stripped.rstrip("/").rstrip()
-                        profile.linkedin_url = f"https://{base.lstrip('htps:/')}/{username}"
+                        # The URL is the line's last token; drop any scheme, it is rebuilt as https
+                        base = URL_SCHEME_PATTERN.sub("", stripped.split()[-1].rstrip("/"))
+                        profile.linkedin_url = f"https://{base}/{username}"
                         consumed_indices.add(i)
                         consumed_indices.add(i + 1)
                 break
             # Also match "username (LinkedIn)" pattern
-            linkedin_ref = re.match(r"^(\w[\w\-]+)\s*\(LinkedIn\)\s*$", stripped, re.IGNORECASE)
+            linkedin_ref = LINKEDIN_REF_PATTERN.match(stripped)
             if linkedin_ref and not profile.linkedin_url:
                 profile.linkedin_url = f"https://www.linkedin.com/in/{linkedin_ref.group(1)}"
                 consumed_indices.add(i)
 
     # Extract name: first non-consumed, non-label line that looks like a name
-    for i, line in enumerate(non_empty):
+    for i, stripped in enumerate(non_empty):
         if i in consumed_indices:
             continue
-        stripped = line.strip()
-        # Skip lines that are clearly not names
-        if EMAIL_PATTERN.search(stripped) or WEBSITE_PATTERN.search(stripped):
-            continue
-        if any(lp.search(stripped) for lp in LABEL_PATTERNS.values()):
-            continue
-        # A name line: typically 2-5 words, no special chars except spaces
-        if re.match(r"^[A-Za-z\s\.\-']{2,60}$", stripped) and len(stripped.split()) <= 5:
+        # A name line: typically 2-5 words, no special chars except spaces. The
+        # allowed characters exclude "@" and ":", so a matching line can never be an
+        # email, URL or "Label:" line and no separate exclusion checks are needed.
+        if 2 <= len(stripped) <= 60 and NAME_CHARS.issuperset(stripped) and len(stripped.split()) <= 5:
             # Strip "Contact" prefix that LinkedIn PDFs sometimes prepend
-            name_cleaned = re.sub(r"^Contact\s+", "", stripped, flags=re.IGNORECASE).strip()
+            name_cleaned = CONTACT_PREFIX_PATTERN.sub("", stripped).strip()
             profile.name = name_cleaned
             consumed_indices.add(i)
             break
 
     # Extract headline: the line with pipe-separated keywords like "Director of AI | GenAI, Cloud"
-    for i, line in enumerate(non_empty):
+    for i, stripped in enumerate(non_empty):
         if i in consumed_indices:
             continue
-        stripped = line.strip()
         if "|" in stripped or (len(stripped) > 20 and not stripped.startswith("•")):
             # Likely a headline — clean off any trailing "Web Link: ..." or "LinkedIn: ..."
-            cleaned = re.sub(r"\s*Web\s*Link\s*:.*$", "", stripped, flags=re.IGNORECASE)
-            cleaned = re.sub(r"\s*LinkedIn\s*:.*$", "", cleaned, flags=re.IGNORECASE)
+            cleaned = WEB_LINK_TAIL_PATTERN.sub("", stripped)
+            cleaned = LINKEDIN_TAIL_PATTERN.sub("", cleaned)
             # Strip leading phone number + (Mobile) pattern
-            cleaned = re.sub(r"^\+?\d[\d\s\-\(\)]{7,15}\d\s*\((?:Mobile|Home|Work)\)\s*", "", cleaned, flags=re.IGNORECASE)
+            cleaned = PHONE_WITH_TYPE_PREFIX_PATTERN.sub("", cleaned)
             cleaned = cleaned.strip()
-            if cleaned and not EMAIL_PATTERN.search(cleaned) and not any(lp.search(cleaned) for lp in LABEL_PATTERNS.values()):
+            # Every label needs a ":", so only search for one when it is present
+            if (cleaned
+                    and not _has_email(cleaned)
+                    and not (":" in cleaned and LABEL_ANYWHERE_PATTERN.search(cleaned))):
                 profile.headline = cleaned
                 consumed_indices.add(i)
                 break
 
     # Fallback location: look for "City, State/Country" pattern
     if not profile.location:
-        for i, line in enumerate(non_empty):
+        for i, stripped in enumerate(non_empty):
             if i in consumed_indices:
                 continue
-            stripped = line.strip()
-            if re.search(r",\s*\w{2,}", stripped) and not EMAIL_PATTERN.search(stripped) and not WEBSITE_PATTERN.search(stripped):
+            if CITY_REGION_PATTERN.search(stripped) and not _has_email(stripped) and not _has_url(stripped):
                 profile.location = stripped
                 break
 
@@ -175,30 +205,28 @@ def extract_contact_from_header(header: str, profile: ParsedProfile) -> ParsedPr
             if sum(c.isdigit() for c in candidate) >= 10:
                 profile.phone = candidate
 
-    logger.info(f"Extracted contact: name={profile.name}, email={profile.email}, "
-                f"phone={profile.phone}, location={profile.location}, "
-                f"linkedin={profile.linkedin_url}")
+    logger.info(
+        "Extracted contact: name=%s, email=%s, phone=%s, location=%s, linkedin=%s",
+        profile.name,
+        profile.email,
+        profile.phone,
+        profile.location,
+        profile.linkedin_url,
+    )
     return profile
 
 
-def calculate_experience_years(experience: list) -> int | None:
-    """Calculate rough total experience years from experience entries."""
-    if not experience:
-        return None
-
-    from datetime import datetime
-
+def calculate_experience_years(date_ranges: Iterable[tuple[str | None, str | None]]) -> int | None:
+    """Calculate rough total experience years from (start_date, end_date) pairs."""
     total_months = 0
-    for exp in experience:
-        start = exp.get("start_date") if isinstance(exp, dict) else getattr(exp, "start_date", None)
-        end = exp.get("end_date") if isinstance(exp, dict) else getattr(exp, "end_date", None)
-
+    now = datetime.now()
+    for start, end in date_ranges:
         if not start:
             continue
 
         try:
             start_dt = _parse_date(start)
-            end_dt = _parse_date(end) if end and end.lower() != "present" else datetime.now()
+            end_dt = _parse_date(end) if end and end.lower() != "present" else now
             if start_dt and end_dt:
                 months = (end_dt.year - start_dt.year) * 12 + (end_dt.month - start_dt.month)
                 total_months += max(0, months)
@@ -208,24 +236,45 @@ def calculate_experience_years(experience: list) -> int | None:
     return total_months // 12 if total_months > 0 else None
 
 
-def _parse_date(date_str: str) -> "datetime | None":
-    from datetime import datetime
+# strptime formats to try, by the shape of the input. Every miss raises, so only
+# the formats that can match are tried, the likely one first: a year ("2020"),
+# an abbreviated month ("Jan 2020") or a full month name ("January 2020").
+_YEAR_FORMATS = ("%Y",)
+_SHORT_MONTH_FORMATS = ("%b %Y", "%B %Y")
+_LONG_MONTH_FORMATS = ("%B %Y", "%b %Y")
+
+# Profile dates come from a small vocabulary ("Jan 2020", "2019", ...) that
+# repeats across entries and profiles, so parsed results are memoized
+DATE_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def _parse_date(date_str: str) -> datetime | None:
     if not date_str:
         return None
-    for fmt in ["%b %Y", "%B %Y", "%Y"]:
+    date_str = date_str.strip()
+    if not date_str:
+        return None
+
+    if date_str[0].isdigit():
+        formats = _YEAR_FORMATS
+    elif len(date_str.split(None, 1)[0]) <= 3:
+        formats = _SHORT_MONTH_FORMATS
+    else:
+        formats = _LONG_MONTH_FORMATS
+
+    for fmt in formats:
         try:
-            return datetime.strptime(date_str.strip(), fmt)
+            return datetime.strptime(date_str, fmt)
         except ValueError:
             continue
     return None
 
 
 def deduplicate_skills(skills: list[str]) -> list[str]:
-    seen: set[str] = set()
-    result: list[str] = []
+    # Keyed by the normalized name; setdefault keeps the first spelling seen
+    unique: dict[str, str] = {}
     for skill in skills:
-        normalized = skill.lower().strip()
-        if normalized not in seen:
-            seen.add(normalized)
-            result.append(skill.strip())
-    return result
+        stripped = skill.strip()
+        unique.setdefault(stripped.lower(), stripped)
+    return list(unique.values())
@@ -5,40 +5,55 @@ If a contact responds at any level, the escalation resets and the agent
 switches to a response-driven conversation mode.
 """
 
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 
-# Level → (days to wait before this level, strategy to use)
-ESCALATION_SCHEDULE: dict[int, dict] = {
-    0: {"days_wait": 0, "strategy": "standard", "label": "Initial outreach"},
-    1: {"days_wait": 4, "strategy": "standard", "label": "Soft follow-up"},
-    2: {"days_wait": 7, "strategy": "different_angle", "label": "Different angle"},
-    3: {"days_wait": 10, "strategy": "urgent", "label": "Urgent / time-sensitive"},
-    4: {"days_wait": 14, "strategy": "warm_intro", "label": "Final attempt"},
-}
+@dataclass(frozen=True, slots=True)
+class EscalationConfig:
+    days_wait: int  # days to wait before this level
+    strategy: str  # strategy to use
+    label: str
+
+
+# Indexed by level
+ESCALATION_SCHEDULE: tuple[EscalationConfig, ...] = (
+    EscalationConfig(days_wait=0, strategy="standard", label="Initial outreach"),
+    EscalationConfig(days_wait=4, strategy="standard", label="Soft follow-up"),
+    EscalationConfig(days_wait=7, strategy="different_angle", label="Different angle"),
+    EscalationConfig(days_wait=10, strategy="urgent", label="Urgent / time-sensitive"),
+    EscalationConfig(days_wait=14, strategy="warm_intro", label="Final attempt"),
+)
 
 MAX_ESCALATION_LEVEL = 5  # At this level → mark cold
 
+# Levels are small ints and the schedule is immutable, so the per-level
+# helpers below are cached; the bound covers every real level with room over
+LEVEL_CACHE_SIZE = 16
+
 
-def get_escalation_config(level: int) -> Optional[dict]:
+def get_escalation_config(level: int) -> Optional[EscalationConfig]:
     """Get escalation config for a given level. Returns None if exhausted."""
-    if level >= MAX_ESCALATION_LEVEL:
+    if not 0 <= level < len(ESCALATION_SCHEDULE) or level >= MAX_ESCALATION_LEVEL:
         return None
-    return ESCALATION_SCHEDULE.get(level)
+    return ESCALATION_SCHEDULE[level]
 
 
+@lru_cache(maxsize=LEVEL_CACHE_SIZE)
 def get_days_until_next_followup(current_level: int) -> Optional[int]:
     """How many days to wait before the next follow-up."""
     next_config = get_escalation_config(current_level + 1)
     if not next_config:
         return None
-    return next_config["days_wait"]
+    return next_config.days_wait
 
 
+@lru_cache(maxsize=LEVEL_CACHE_SIZE)
 def get_strategy_for_level(level: int) -> str:
     """Get the recommended strategy for an escalation level."""
     config = get_escalation_config(level)
-    return config["strategy"] if config else "standard"
+    return config.strategy if config else "standard"
 
 
 def should_mark_cold(level: int) -> bool:
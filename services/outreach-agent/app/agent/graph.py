@@ -8,8 +8,10 @@ graph execution for each contact that needs attention.
 """
 
 import logging
+from functools import lru_cache
 
 from langgraph.graph import StateGraph, END
+from langgraph.graph.state import CompiledStateGraph
 
 from app.agent.state import AgentState
 from app.agent.nodes import observe_node, reason_node, compose_node, act_node
@@ -17,7 +19,7 @@ from app.agent.nodes import observe_node, reason_node, compose_node, act_node
 logger = logging.getLogger(__name__)
 
 
-def build_agent_graph() -> StateGraph:
+def build_agent_graph() -> CompiledStateGraph:
     """Build and compile the agent LangGraph."""
 
     workflow = StateGraph(AgentState)
@@ -40,5 +42,7 @@ def build_agent_graph() -> StateGraph:
     return workflow.compile()
 
 
-# Compiled graph — reuse across invocations
-agent_graph = build_agent_graph()
+@lru_cache(maxsize=1)
+def get_agent_graph() -> CompiledStateGraph:
+    """The compiled graph, built on first use and reused across invocations."""
+    return build_agent_graph()
@@ -1,15 +1,19 @@
 """Job: Check Gmail inbox for new responses and process them."""
 
+import asyncio
 import logging
 from datetime import datetime, timedelta, timezone
 
 from sqlalchemy import select, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import MultipleResultsFound
+from sqlalchemy.orm import joinedload
 
 from app.db.session import async_session_factory
 from app.models.contact import OutreachContact
 from app.models.thread import ConversationThread
 from app.models.message import ConversationMessage
+from app.models.job_state import AgentJobState
 from app.services.gmail_service import gmail_service
 from app.services.llm_service import llm_service
 from app.services.action_logger import log_action
@@ -17,8 +21,39 @@ from app.agent.jobs.send_outreach import execute_outreach_for_contact
 
 logger = logging.getLogger(__name__)
 
-# Track last check time in memory (recovered from DB on restart)
-_last_check_time: datetime = None
+# Row in agent_job_state holding the inbox watermark. It survives restarts, and
+# its row lock keeps two workers from processing the same window.
+INBOX_JOB_NAME = "check_inbox"
+INITIAL_LOOKBACK = timedelta(hours=1)
+
+# analyze_response only reads the last 3 messages of the thread
+THREAD_CONTEXT_LIMIT = 3
+
+# LLM analyses and agent replies in flight at once. They dominate the job's
+# latency and are independent across messages; database work stays on the
+# job's single session, which must not be shared between coroutines.
+INBOX_CONCURRENCY = 8
+
+# Auto-replies and bounces, recognised from the subject or sender alone. They
+# get a fixed analysis instead of an LLM call and are only stored and logged:
+# they never change the contact's status or trigger an agent reply.
+AUTO_REPLY_SUBJECT_MARKERS = (
+    "out of office",
+    "automatic reply",
+    "auto-reply",
+    "autoreply",
+    "delivery status notification",
+    "undeliverable",
+    "mail delivery failed",
+)
+AUTO_REPLY_SENDER_MARKERS = ("mailer-daemon@", "postmaster@")
+AUTO_REPLY_ANALYSIS = {
+    "sentiment": "neutral",
+    "interest_level": "none",
+    "key_points": (),
+    "suggested_action": "wait",
+    "summary": "Automatic reply or delivery notification",
+}
 
 
 async def check_inbox_job():
@@ -26,127 +61,297 @@ async def check_inbox_job():
     Poll Gmail inbox for new messages, match them to contacts,
     analyze with LLM, and trigger agent responses.
     """
-    global _last_check_time
+    async with async_session_factory() as state_db:
+        try:
+            state = await _lock_job_state(state_db)
+            if state is None:
+                logger.info("[INBOX CHECK] Another worker holds the inbox watermark — skipping")
+                return
 
-    if _last_check_time is None:
-        _last_check_time = datetime.now(timezone.utc) - timedelta(hours=1)
+            since = state.last_run_at
+            logger.info(f"[INBOX CHECK] Checking for messages since {since.isoformat()}")
 
-    logger.info(f"[INBOX CHECK] Checking for messages since {_last_check_time.isoformat()}")
+            new_messages = await gmail_service.get_new_messages(since_timestamp=since)
 
-    try:
-        new_messages = await gmail_service.get_new_messages(since_timestamp=_last_check_time)
-        _last_check_time = datetime.now(timezone.utc)
+            if not new_messages:
+                logger.info("[INBOX CHECK] No new messages")
+                return
 
-        if not new_messages:
-            logger.info("[INBOX CHECK] No new messages")
-            return
+            logger.info(f"[INBOX CHECK] Found {len(new_messages)} new message(s)")
 
-        logger.info(f"[INBOX CHECK] Found {len(new_messages)} new message(s)")
+            async with async_session_factory() as db:
+                replies = await _process_inbound_messages(db, new_messages)
+            await _trigger_replies(replies)
 
-        async with async_session_factory() as db:
-            for msg in new_messages:
-                try:
-                    await _process_inbound_message(db, msg)
-                except Exception as e:
-                    logger.error(f"[INBOX CHECK] Error processing message {msg.get('message_id')}: {e}")
+            # Advance to the newest message seen rather than the wall clock, so
+            # mail arriving while the batch was fetched is picked up next run.
+            # Messages re-fetched at the boundary are skipped as already stored.
+            state.last_run_at = max(
+                [since, *(m["received_at"] for m in new_messages if m.get("received_at"))]
+            )
+            await state_db.commit()
+
+        except Exception as e:
+            logger.error(f"[INBOX CHECK] Job failed: {e}", exc_info=True)
+
+
+async def _lock_job_state(db) -> AgentJobState | None:
+    """Lock the inbox watermark row, creating it on first run; None if another worker holds it."""
+    await db.execute(
+        insert(AgentJobState)
+        .values(name=INBOX_JOB_NAME, last_run_at=func.now() - INITIAL_LOOKBACK)
+        .on_conflict_do_nothing(index_elements=["name"])
+    )
+    result = await db.execute(
+        select(AgentJobState)
+        .where(AgentJobState.name == INBOX_JOB_NAME)
+        .with_for_update(skip_locked=True)
+    )
+    return result.scalar_one_or_none()
+
+
+async def _prefetch_lookups(db, messages: list[dict]) -> dict:
+    """
+    Load every thread, contact and stored message id the batch can match in
+    three queries, instead of up to three queries per message.
+    """
+    thread_ids = {m["thread_id"] for m in messages if m.get("thread_id")}
+    emails = {e for m in messages if (e := m.get("from_email", "").lower().strip())}
+    message_ids = {m["message_id"] for m in messages if m.get("message_id")}
+
+    threads: dict[str, list[ConversationThread]] = {}
+    if thread_ids:
+        result = await db.execute(
+            select(ConversationThread)
+            .options(joinedload(ConversationThread.contact))  # many-to-one: same round-trip
+            .where(ConversationThread.gmail_thread_id.in_(thread_ids))
+        )
+        for thread in result.scalars():
+            threads.setdefault(thread.gmail_thread_id, []).append(thread)
+
+    contacts: dict[str, list[OutreachContact]] = {}
+    if emails:
+        result = await db.execute(
+            select(OutreachContact)
+            .where(func.lower(OutreachContact.email).in_(emails))
+        )
+        for contact in result.scalars():
+            contacts.setdefault(contact.email.lower(), []).append(contact)
+
+    # Only the ids are needed, so no ORM objects are built for stored messages
+    known_message_ids: set[str] = set()
+    if message_ids:
+        result = await db.execute(
+            select(ConversationMessage.gmail_message_id).where(
+                ConversationMessage.gmail_message_id.in_(message_ids)
+            )
+        )
+        known_message_ids.update(result.scalars())
+
+    return {"threads": threads, "contacts": contacts, "message_ids": known_message_ids}
+
+
+def _one_or_none(index: dict[str, list], key: str):
+    """Same contract as scalar_one_or_none() over a prefetched index."""
+    matches = index.get(key)
+    if not matches:
+        return None
+    if len(matches) > 1:
+        raise MultipleResultsFound(f"Multiple rows found for {key!r}")
+    return matches[0]
+
+
+async def _process_inbound_messages(db, messages: list[dict]) -> dict:
+    """
+    Match, analyze and store a batch of inbound emails.
+
+    Returns the contacts to reply to, as {contact_id: [contact name per message]}.
+    """
+    lookups = await _prefetch_lookups(db, messages)
+
+    # Matching and thread history are cheap queries on the shared session
+    matched = []
+    for msg in messages:
+        try:
+            inbound = await _match_inbound_message(db, msg, lookups)
+        except Exception as e:
+            logger.error(f"[INBOX CHECK] Error processing message {msg.get('message_id')}: {e}")
+            continue
+        if inbound:
+            matched.append(inbound)
+
+    # Analyze the responses with LLM, concurrently
+    semaphore = asyncio.Semaphore(INBOX_CONCURRENCY)
+
+    async def analyze(inbound: dict) -> dict:
+        if inbound["auto_reply"]:
+            return dict(AUTO_REPLY_ANALYSIS)
+        async with semaphore:
+            return await llm_service.analyze_response(
+                message_body=inbound["msg"].get("body_text", ""),
+                thread_context=inbound["thread_history"],
+            )
 
-    except Exception as e:
-        logger.error(f"[INBOX CHECK] Job failed: {e}", exc_info=True)
+    analyses = await asyncio.gather(*map(analyze, matched), return_exceptions=True)
+
+    replies: dict = {}
+    for inbound, analysis in zip(matched, analyses):
+        try:
+            if isinstance(analysis, BaseException):
+                raise analysis
+            contact = await _store_inbound_message(db, inbound, analysis, lookups)
+        except Exception as e:
+            logger.error(f"[INBOX CHECK] Error processing message {inbound['msg'].get('message_id')}: {e}")
+            continue
+        if contact:
+            replies.setdefault(contact.id, []).append(contact.name)
+    return replies
+
+
+def _is_auto_reply(msg: dict, from_email: str) -> bool:
+    """Cheap pre-filter for out-of-office replies and bounces."""
+    subject = (msg.get("subject") or "").lower()
+    return any(marker in subject for marker in AUTO_REPLY_SUBJECT_MARKERS) or any(
+        marker in from_email for marker in AUTO_REPLY_SENDER_MARKERS
+    )
 
 
-async def _process_inbound_message(db, msg: dict):
-    """Process a single inbound email — match to contact and analyze."""
+async def _match_inbound_message(db, msg: dict, lookups: dict) -> dict | None:
+    """Match a single inbound email to its contact and thread; None to skip it."""
     from_email = msg.get("from_email", "").lower().strip()
     gmail_thread_id = msg.get("thread_id")
     gmail_message_id = msg.get("message_id")
 
     if not from_email:
-        return
+        return None
 
     # Try to match by Gmail thread ID first
     contact = None
     thread = None
 
     if gmail_thread_id:
-        result = await db.execute(
-            select(ConversationThread)
-            .options(
-                selectinload(ConversationThread.contact).selectinload(OutreachContact.firm),
-                selectinload(ConversationThread.messages),
-            )
-            .where(ConversationThread.gmail_thread_id == gmail_thread_id)
-        )
-        thread = result.scalar_one_or_none()
+        thread = _one_or_none(lookups["threads"], gmail_thread_id)
         if thread:
             contact = thread.contact
 
     # Fallback: match by sender email
     if not contact:
-        result = await db.execute(
-            select(OutreachContact)
-            .options(selectinload(OutreachContact.firm))
-            .where(func.lower(OutreachContact.email) == from_email)
-        )
-        contact = result.scalar_one_or_none()
+        contact = _one_or_none(lookups["contacts"], from_email)
 
     if not contact:
         logger.debug(f"[INBOX CHECK] No matching contact for {from_email} — skipping")
-        return
+        return None
 
-    # Check if we already have this message
-    result = await db.execute(
-        select(ConversationMessage).where(
-            ConversationMessage.gmail_message_id == gmail_message_id
-        )
-    )
-    if result.scalar_one_or_none():
+    # Check if we already have this message (or it repeats within the batch)
+    if gmail_message_id in lookups["message_ids"]:
         logger.debug(f"[INBOX CHECK] Message {gmail_message_id} already stored — skipping")
-        return
+        return None
+    if gmail_message_id:
+        lookups["message_ids"].add(gmail_message_id)
 
     logger.info(f"[INBOX CHECK] New response from {contact.name} ({from_email})")
 
-    # Analyze the response with LLM
+    auto_reply = _is_auto_reply(msg, from_email)
+
     thread_history = []
-    if thread:
+    if thread and not auto_reply:
+        # Only the columns and the tail of the thread the analysis uses
+        result = await db.execute(
+            select(
+                ConversationMessage.direction,
+                ConversationMessage.body_text,
+                ConversationMessage.subject,
+                ConversationMessage.sent_at,
+            )
+            .where(ConversationMessage.thread_id == thread.id)
+            .order_by(ConversationMessage.sent_at.desc())
+            .limit(THREAD_CONTEXT_LIMIT)
+        )
         thread_history = [
             {
-                "direction": m.direction,
-                "body_text": m.body_text or "",
-                "subject": m.subject or "",
-                "sent_at": m.sent_at.isoformat() if m.sent_at else "",
+                "direction": direction,
+                "body_text": body_text or "",
+                "subject": subject or "",
+                "sent_at": sent_at.isoformat() if sent_at else "",
             }
-            for m in (thread.messages or [])
+            for direction, body_text, subject, sent_at in reversed(result.all())
         ]
 
-    analysis = await llm_service.analyze_response(
-        message_body=msg.get("body_text", ""),
-        thread_context=thread_history,
-    )
+    return {
+        "msg": msg,
+        "from_email": from_email,
+        "contact": contact,
+        "thread": thread,
+        "thread_history": thread_history,
+        "auto_reply": auto_reply,
+    }
+
+
+async def _store_inbound_message(db, inbound: dict, analysis: dict, lookups: dict):
+    """Store an analyzed inbound email and update statuses; returns the contact to reply to, if any."""
+    msg = inbound["msg"]
+    contact = inbound["contact"]
+    gmail_thread_id = msg.get("thread_id")
+    gmail_message_id = msg.get("message_id")
+
+    # An earlier message in this batch may have created the thread
+    thread = inbound["thread"]
+    if not thread and gmail_thread_id:
+        thread = _one_or_none(lookups["threads"], gmail_thread_id)
 
     # Create thread if doesn't exist
-    if not thread:
+    created_thread = not thread
+    if created_thread:
         thread = ConversationThread(
             contact_id=contact.id,
             gmail_thread_id=gmail_thread_id,
             subject=msg.get("subject"),
+            messages=[],
         )
         db.add(thread)
         await db.flush()
+        # Later messages in this batch on the same Gmail thread attach to it
+        if gmail_thread_id:
+            lookups["threads"][gmail_thread_id] = [thread]
 
-    # Store the inbound message
-    message = ConversationMessage(
-        thread_id=thread.id,
-        gmail_message_id=gmail_message_id,
-        direction="inbound",
-        from_email=from_email,
-        to_email=msg.get("to_email", ""),
-        subject=msg.get("subject"),
-        body_text=msg.get("body_text"),
-        sentiment=analysis.get("sentiment"),
-        llm_analysis=analysis,
-        sent_at=msg.get("received_at", datetime.now(timezone.utc)),
+    # Store the inbound message. The unique index on gmail_message_id makes this
+    # idempotent if another run stored it since the batch was prefetched.
+    result = await db.execute(
+        insert(ConversationMessage)
+        .values(
+            thread_id=thread.id,
+            gmail_message_id=gmail_message_id,
+            direction="inbound",
+            from_email=inbound["from_email"],
+            to_email=msg.get("to_email", ""),
+            subject=msg.get("subject"),
+            body_text=msg.get("body_text"),
+            sentiment=analysis.get("sentiment"),
+            llm_analysis=analysis,
+            sent_at=msg.get("received_at", datetime.now(timezone.utc)),
+        )
+        .on_conflict_do_nothing(index_elements=["gmail_message_id"])
+        .returning(ConversationMessage.id)
     )
-    db.add(message)
+    if result.scalar_one_or_none() is None:
+        logger.debug(f"[INBOX CHECK] Message {gmail_message_id} stored concurrently — skipping")
+        if created_thread:
+            await db.delete(thread)
+            lookups["threads"].pop(gmail_thread_id, None)
+        await db.commit()
+        return None
+
+    if inbound["auto_reply"]:
+        await db.commit()
+        await log_action(
+            db,
+            action_type="auto_reply",
+            contact_id=contact.id,
+            thread_id=thread.id,
+            description=f"Stored automatic reply from {contact.name}: {msg.get('subject') or ''}",
+            output_data=analysis,
+        )
+        return None
 
     # Update contact status
     if contact.status in ("new", "contacted"):
@@ -171,10 +376,24 @@ async def _process_inbound_message(db, msg: dict):
         output_data=analysis,
         llm_model_used="claude",
     )
+    return contact
+
+
+async def _trigger_replies(replies: dict):
+    """
+    Trigger the agent reply for each stored message. Each reply opens its own
+    session, so different contacts run concurrently; one contact's replies
+    run in order so they never race each other.
+    """
+    semaphore = asyncio.Semaphore(INBOX_CONCURRENCY)
+
+    async def reply_to(contact_id, names: list[str]):
+        async with semaphore:
+            for name in names:
+                logger.info(f"[INBOX CHECK] Triggering agent response for {name}")
+                try:
+                    await execute_outreach_for_contact(contact_id)
+                except Exception as e:
+                    logger.error(f"[INBOX CHECK] Failed to trigger response for {name}: {e}")
 
-    # Trigger agent to compose a reply
-    logger.info(f"[INBOX CHECK] Triggering agent response for {contact.name}")
-    try:
-        await execute_outreach_for_contact(contact.id)
-    except Exception as e:
-        logger.error(f"[INBOX CHECK] Failed to trigger response for {contact.name}: {e}")
+    await asyncio.gather(*(reply_to(contact_id, names) for contact_id, names in replies.items()))
@@ -7,6 +7,8 @@ from sqlalchemy import select, func
 
 from app.db.session import async_session_factory
 from app.models.contact import OutreachContact
+from app.models.firm import OutreachFirm
+from app.models.message import ConversationMessage
 from app.models.action import AgentAction
 from app.models.briefing import DailyBriefing
 from app.services.llm_service import llm_service
@@ -37,11 +39,8 @@ async def daily_briefing_job():
                 logger.info("[DAILY BRIEFING] Already sent today — skipping")
                 return
 
-            # Gather today's stats
-            stats = await _gather_stats(db)
-
-            # Gather yesterday's stats for comparison
-            yesterday_stats = await _gather_yesterday_stats(db)
+            # Gather today's stats, and yesterday's for comparison
+            stats, yesterday_stats = await _gather_stats(db)
 
             # Get notable events from last 24 hours
             notable_events = await _get_notable_events(db)
@@ -96,63 +95,69 @@ async def daily_briefing_job():
                 pass
 
 
-async def _gather_stats(db) -> dict:
-    """Gather current aggregate stats."""
-    result = await db.execute(
-        select(
-            OutreachContact.status,
-            func.count().label("count"),
-        )
-        .group_by(OutreachContact.status)
-    )
-    status_counts = {row.status: row.count for row in result.all()}
-
-    from app.models.firm import OutreachFirm
-    result = await db.execute(select(func.count()).select_from(OutreachFirm))
-    total_firms = result.scalar() or 0
-
-    return {
-        "total_firms": total_firms,
-        "total_contacts": sum(status_counts.values()),
-        "not_contacted": status_counts.get("new", 0),
-        "contacted": status_counts.get("contacted", 0),
-        "responded": status_counts.get("responded", 0),
-        "in_conversation": status_counts.get("in_conversation", 0),
-        "converted": status_counts.get("converted", 0),
-        "cold": status_counts.get("cold", 0),
-    }
-
-
-async def _gather_yesterday_stats(db) -> dict:
-    """Gather stats from yesterday for comparison."""
+async def _gather_stats(db) -> tuple[dict, dict]:
+    """
+    Gather current aggregate stats and yesterday's stats for comparison,
+    in one round-trip: every figure is an aggregate or scalar subquery of a
+    single SELECT.
+    """
     yesterday = datetime.now(timezone.utc) - timedelta(days=1)
     yesterday_start = yesterday.replace(hour=0, minute=0, second=0, microsecond=0)
 
-    # Yesterday's briefing stats (if exists)
+    def status_count(status: str):
+        return func.count().filter(OutreachContact.status == status)
+
     result = await db.execute(
-        select(DailyBriefing).where(DailyBriefing.briefing_date == yesterday.date())
+        select(
+            select(func.count()).select_from(OutreachFirm).scalar_subquery().label("total_firms"),
+            func.count().label("total_contacts"),
+            status_count("new").label("not_contacted"),
+            status_count("contacted").label("contacted"),
+            status_count("responded").label("responded"),
+            status_count("in_conversation").label("in_conversation"),
+            status_count("converted").label("converted"),
+            status_count("cold").label("cold"),
+            # Yesterday's briefing stats (if exists)
+            select(DailyBriefing.stats)
+            .where(DailyBriefing.briefing_date == yesterday.date())
+            .scalar_subquery()
+            .label("yesterday_stats"),
+            # New responses since yesterday
+            select(func.count())
+            .select_from(ConversationMessage)
+            .where(
+                ConversationMessage.direction == "inbound",
+                ConversationMessage.created_at >= yesterday_start,
+            )
+            .scalar_subquery()
+            .label("new_responses"),
+        ).select_from(OutreachContact)
     )
-    yesterday_briefing = result.scalar_one_or_none()
-    if yesterday_briefing and yesterday_briefing.stats:
-        return {
-            **yesterday_briefing.stats,
+    row = result.one()
+
+    stats = {
+        "total_firms": row.total_firms or 0,
+        "total_contacts": row.total_contacts,
+        "not_contacted": row.not_contacted,
+        "contacted": row.contacted,
+        "responded": row.responded,
+        "in_conversation": row.in_conversation,
+        "converted": row.converted,
+        "cold": row.cold,
+    }
+
+    if row.yesterday_stats:
+        yesterday_stats = {
+            **row.yesterday_stats,
             "new_responses": 0,  # Will be calculated below
         }
+    else:
+        yesterday_stats = {
+            "contacted": 0,
+            "new_responses": row.new_responses or 0,
+        }
 
-    # Count new responses since yesterday
-    from app.models.message import ConversationMessage
-    result = await db.execute(
-        select(func.count()).select_from(ConversationMessage).where(
-            ConversationMessage.direction == "inbound",
-            ConversationMessage.created_at >= yesterday_start,
-        )
-    )
-    new_responses = result.scalar() or 0
-
-    return {
-        "contacted": 0,
-        "new_responses": new_responses,
-    }
+    return stats, yesterday_stats
 
 
 async def _get_notable_events(db) -> list[dict]:
@@ -3,15 +3,17 @@
 import logging
 from datetime import datetime, timezone
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 
 from app.db.session import async_session_factory
 from app.models.scheduled_task import AgentScheduledTask
-from app.agent.jobs.send_outreach import execute_outreach_for_contact
+from app.agent.jobs.send_outreach import execute_outreach_for_contacts
 from app.services.action_logger import log_action
 
 logger = logging.getLogger(__name__)
 
+SEND_TASK_TYPES = ("send_initial", "send_followup")
+
 
 async def process_scheduled_tasks_job():
     """
@@ -40,20 +42,40 @@ async def process_scheduled_tasks_job():
 
             logger.info(f"[PROCESS TASKS] Processing {len(tasks)} pending task(s)")
 
+            # Claim the whole batch in one statement; per-task results are
+            # committed together once the batch is done
+            await db.execute(
+                update(AgentScheduledTask)
+                .where(AgentScheduledTask.id.in_([task.id for task in tasks]))
+                .values(status="running")
+            )
+            await db.commit()
+
+            # Run every send task's contact through the agent as one batch. Only
+            # a failure before any graph starts fails the whole batch; after
+            # that, only the contacts reported back are failed
+            send_tasks = [task for task in tasks if task.task_type in SEND_TASK_TYPES]
+            batch_error = None
+            failed_contacts: set = set()
+            try:
+                failed_contacts = await execute_outreach_for_contacts(
+                    [task.contact_id for task in send_tasks if task.contact_id]
+                )
+            except Exception as e:
+                batch_error = e
+
             for task in tasks:
                 try:
-                    task.status = "running"
-                    await db.commit()
-
-                    if task.task_type in ("send_initial", "send_followup"):
-                        if task.contact_id:
-                            await execute_outreach_for_contact(task.contact_id)
+                    if task.task_type in SEND_TASK_TYPES:
+                        if batch_error and task.contact_id:
+                            raise batch_error
+                        if task.contact_id in failed_contacts:
+                            raise RuntimeError(f"Agent run failed for contact {task.contact_id}")
                     else:
                         logger.warning(f"[PROCESS TASKS] Unknown task type: {task.task_type}")
 
                     task.status = "completed"
                     task.executed_at = datetime.now(timezone.utc)
-                    await db.commit()
 
                     logger.info(f"[PROCESS TASKS] Completed task {task.id} ({task.task_type})")
 
@@ -69,6 +91,8 @@ async def process_scheduled_tasks_job():
                         task.status = "pending"  # Will retry on next cycle
                         task.error_message = f"Retry {task.retry_count}: {str(e)}"
 
+                    # Commit before log_action, whose rollback on failure would
+                    # otherwise discard the results recorded so far
                     await db.commit()
 
                     await log_action(
@@ -80,5 +104,7 @@ async def process_scheduled_tasks_job():
                         error_message=str(e),
                     )
 
+            await db.commit()
+
         except Exception as e:
             logger.error(f"[PROCESS TASKS] Job failed: {e}", exc_info=True)
@@ -28,24 +28,28 @@ async def scan_new_contacts_job():
     """
     async with async_session_factory() as db:
         try:
-            # Subquery: contact IDs that already have a pending/running task
-            pending_task_subquery = (
-                select(AgentScheduledTask.contact_id).where(
+            # Correlated NOT EXISTS: a contact is live if it has a pending/running
+            # send task (answered from the partial idx_scheduled_tasks_live_contact)
+            has_live_task = (
+                select(AgentScheduledTask.id)
+                .where(
+                    AgentScheduledTask.contact_id == OutreachContact.id,
                     AgentScheduledTask.status.in_(["pending", "running"]),
                     AgentScheduledTask.task_type.in_(["send_initial", "send_followup"]),
                 )
+                .exists()
             )
 
-            # Find 'new' contacts NOT in that subquery
+            # Find 'new' contacts without one
             result = await db.execute(
                 select(OutreachContact.id)
                 .where(
                     OutreachContact.status == "new",
-                    ~OutreachContact.id.in_(pending_task_subquery),
+                    ~has_live_task,
                 )
                 .limit(100)  # Process max 100 at a time
             )
-            orphan_contact_ids = [row[0] for row in result.all()]
+            orphan_contact_ids = result.scalars().all()
 
             if not orphan_contact_ids:
                 return  # Nothing to do — happy path
@@ -1,10 +1,12 @@
 """Job: Send outreach email to a contact using the agent graph."""
 
+import asyncio
 import logging
 import uuid
 from datetime import datetime, timedelta, timezone
+from typing import Sequence
 
-from sqlalchemy import select, func
+from sqlalchemy import Row, select, func
 from sqlalchemy.orm import selectinload
 
 from app.db.session import async_session_factory
@@ -12,10 +14,11 @@ from app.models.contact import OutreachContact
 from app.models.thread import ConversationThread
 from app.models.message import ConversationMessage
 from app.models.scheduled_task import AgentScheduledTask
-from app.agent.graph import agent_graph
+from app.agent.graph import get_agent_graph
 from app.agent.state import AgentState
 from app.agent.escalation import get_days_until_next_followup, get_strategy_for_level
-from app.services.action_logger import log_action
+from app.services.action_logger import log_actions
+from app.config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -25,195 +28,342 @@ async def execute_outreach_for_contact(contact_id: uuid.UUID):
     Execute the full agent graph for a single contact.
 
     This is called by:
-    1. The scheduler (process_tasks job)
+    1. The inbox job, to reply to a response
     2. Manual trigger via API
     """
+    await execute_outreach_for_contacts([contact_id])
+
+
+async def execute_outreach_for_contacts(contact_ids: Sequence[uuid.UUID]) -> set[uuid.UUID]:
+    """
+    Execute the agent graph for a batch of contacts.
+
+    Contacts, firms and each contact's latest thread are loaded for the whole
+    batch up front on one session, which then releases its connection. The
+    graphs, which are dominated by LLM and Gmail calls and never touch the
+    database, then run concurrently (bounded by agent_concurrency_limit). Their
+    outcomes are persisted one at a time on the shared session, which must not
+    be used by two coroutines at once. A contact listed more than once is
+    processed once. The audit trail for the batch is buffered and written in a
+    single insert once every outcome is persisted.
+
+    Returns the ids of contacts whose run failed before any email was sent, for
+    the caller to retry. Once the graphs have started this never raises: emails
+    may already have gone out for the rest of the batch, and those contacts
+    must not be retried.
+
+    This is called by the scheduler (process_tasks job).
+    """
+    contact_ids = list(dict.fromkeys(contact_ids))
     async with async_session_factory() as db:
-        try:
-            # Load contact with firm
-            result = await db.execute(
-                select(OutreachContact)
-                .options(selectinload(OutreachContact.firm))
-                .where(OutreachContact.id == contact_id)
-            )
-            contact = result.scalar_one_or_none()
-            if not contact:
+        targets = await _load_outreach_targets(db, contact_ids)
+
+        initial_states: dict[uuid.UUID, AgentState] = {}
+        for contact_id in contact_ids:
+            target = targets.get(contact_id)
+            if not target:
                 logger.warning(f"Contact {contact_id} not found")
-                return
+                continue
 
+            contact, thread, history = target
             if contact.status in ("cold", "converted"):
                 logger.info(f"Skipping {contact.name} — status is {contact.status}")
-                return
-
-            # Load existing thread and history
-            result = await db.execute(
-                select(ConversationThread)
-                .options(selectinload(ConversationThread.messages))
-                .where(ConversationThread.contact_id == contact_id)
-                .order_by(ConversationThread.created_at.desc())
-                .limit(1)
-            )
-            thread = result.scalar_one_or_none()
-
-            thread_history = []
-            gmail_thread_id = None
-            escalation_level = 0
-
-            if thread:
-                gmail_thread_id = thread.gmail_thread_id
-                escalation_level = thread.escalation_level
-                thread_history = [
-                    {
-                        "direction": m.direction,
-                        "body_text": m.body_text or "",
-                        "subject": m.subject or "",
-                        "sent_at": m.sent_at.isoformat() if m.sent_at else "",
-                        "sentiment": m.sentiment,
-                    }
-                    for m in (thread.messages or [])
-                ]
-
-            # Calculate days since last contact
-            days_since = 0
-            if contact.last_contacted_at:
-                delta = datetime.now(timezone.utc) - contact.last_contacted_at
-                days_since = delta.days
-
-            # Build initial state
-            initial_state: AgentState = {
-                "contact_id": contact.id,
-                "contact_name": contact.name,
-                "contact_email": contact.email,
-                "contact_title": contact.title or "",
-                "firm_name": contact.firm.name if contact.firm else "Unknown",
-                "current_status": contact.status,
-                "escalation_level": escalation_level,
-                "strategy": get_strategy_for_level(escalation_level),
-                "days_since_last_contact": days_since,
-                "thread_id": thread.id if thread else None,
-                "gmail_thread_id": gmail_thread_id,
-                "thread_history": thread_history,
-                "new_inbound_message": None,
-                "action_decided": None,
-                "action_reasoning": None,
-                "email_composed": None,
-                "analysis_result": None,
-                "send_result": None,
-                "error": None,
-            }
+                continue
 
-            # Run the agent graph
-            logger.info(f"Running agent graph for {contact.name} ({contact.email})")
-            final_state = await agent_graph.ainvoke(initial_state)
-
-            # Process results
-            action = final_state.get("action_decided", "skip")
-            send_result = final_state.get("send_result")
-            email_composed = final_state.get("email_composed")
-            error = final_state.get("error")
-
-            if action == "mark_cold":
-                contact.status = "cold"
-                await db.commit()
-                await log_action(
-                    db,
-                    action_type="mark_cold",
-                    contact_id=contact.id,
-                    description=f"Marked {contact.name} as cold — {final_state.get('action_reasoning', '')}",
-                )
-                return
-
-            if action in ("skip", "wait"):
-                await log_action(
-                    db,
-                    action_type=action,
-                    contact_id=contact.id,
-                    description=final_state.get("action_reasoning", ""),
-                )
-                return
-
-            if send_result and email_composed:
-                # Create or update thread
-                if not thread:
-                    thread = ConversationThread(
-                        contact_id=contact.id,
-                        gmail_thread_id=send_result.get("thread_id"),
-                        subject=email_composed.get("subject"),
-                        strategy=final_state.get("strategy", "standard"),
-                    )
-                    db.add(thread)
-                    await db.flush()
-                else:
-                    thread.gmail_thread_id = send_result.get("thread_id") or thread.gmail_thread_id
-                    thread.escalation_level = escalation_level + 1
-                    thread.strategy = final_state.get("strategy", thread.strategy)
-
-                # Store outbound message
-                message = ConversationMessage(
-                    thread_id=thread.id,
-                    gmail_message_id=send_result.get("message_id"),
-                    direction="outbound",
-                    from_email=f"suchi@agent",
-                    to_email=contact.email,
-                    subject=email_composed.get("subject"),
-                    body_text=email_composed.get("body_text"),
-                    body_html=email_composed.get("body_html"),
-                )
-                db.add(message)
-
-                # Update contact status
-                contact.status = "contacted" if contact.status == "new" else contact.status
-                contact.last_contacted_at = datetime.now(timezone.utc)
-
-                # Schedule next follow-up
-                next_days = get_days_until_next_followup(escalation_level)
-                if next_days:
-                    contact.next_followup_at = datetime.now(timezone.utc) + timedelta(days=next_days)
-                    task = AgentScheduledTask(
-                        contact_id=contact.id,
-                        task_type="send_followup",
-                        scheduled_for=contact.next_followup_at,
-                        payload={"escalation_level": escalation_level + 1},
-                    )
-                    db.add(task)
-
-                await db.commit()
-
-                await log_action(
-                    db,
-                    action_type=f"send_{action.replace('send_', '')}",
-                    contact_id=contact.id,
-                    thread_id=thread.id,
-                    description=f"Sent {action} to {contact.name} at {contact.firm.name if contact.firm else 'Unknown'}",
-                    output_data={
-                        "subject": email_composed.get("subject"),
-                        "gmail_message_id": send_result.get("message_id"),
-                    },
-                    llm_model_used="claude",
-                )
+            initial_states[contact_id] = _build_initial_state(contact, thread, history)
+
+        # End the read transaction so the connection goes back to the pool while
+        # the graphs run (often minutes of LLM and Gmail calls) instead of sitting
+        # idle in transaction; expire_on_commit=False keeps the loaded objects
+        await db.commit()
 
-                logger.info(f"Outreach completed for {contact.name}")
+        semaphore = asyncio.Semaphore(max(settings.agent_concurrency_limit, 1))
 
-            elif error:
-                await log_action(
-                    db,
-                    action_type="error",
-                    contact_id=contact.id,
-                    description=f"Agent error for {contact.name}",
-                    status="failed",
-                    error_message=error,
+        async def run_graph(initial_state: AgentState) -> dict:
+            async with semaphore:
+                logger.info(
+                    f"Running agent graph for {initial_state['contact_name']} ({initial_state['contact_email']})"
                 )
+                return await get_agent_graph().ainvoke(initial_state)
+
+        final_states = await asyncio.gather(
+            *map(run_graph, initial_states.values()), return_exceptions=True
+        )
+
+        actions: list[dict] = []
+        failed: set[uuid.UUID] = set()
+
+        def record_failure(contact_id: uuid.UUID, e: BaseException, final_state: dict | None = None):
+            logger.error(f"Agent execution failed for contact {contact_id}: {e}", exc_info=e)
+            # A contact whose email already went out is not retried, even if its
+            # outcome could not be stored: a retry would send it a second email
+            if not (final_state and final_state.get("send_result")):
+                failed.add(contact_id)
+            actions.append(dict(
+                action_type="error",
+                contact_id=contact_id,
+                description="Unhandled agent error",
+                status="failed",
+                error_message=str(e),
+            ))
+
+        pending = list(zip(initial_states.items(), final_states))
+        for index, ((contact_id, initial_state), final_state) in enumerate(pending):
+            if isinstance(final_state, BaseException):
+                # The graph never reached the session; nothing to roll back
+                record_failure(contact_id, final_state)
+                continue
 
-        except Exception as e:
-            logger.error(f"Agent execution failed for contact {contact_id}: {e}", exc_info=True)
             try:
-                await log_action(
-                    db,
-                    action_type="error",
-                    contact_id=contact_id,
-                    description="Unhandled agent error",
-                    status="failed",
-                    error_message=str(e),
+                contact, thread, _ = targets[contact_id]
+                await _apply_outcome(
+                    db, contact, thread, initial_state["escalation_level"], final_state, actions
                 )
-            except Exception:
-                pass
+            except Exception as e:
+                record_failure(contact_id, e, final_state)
+                try:
+                    await db.rollback()
+                    # The rollback expired every loaded object; reload the batch
+                    targets = await _load_outreach_targets(db, list(initial_states))
+                except Exception as reload_error:
+                    # Without a usable session the remaining outcomes cannot be stored
+                    for (remaining_id, _), remaining_state in pending[index + 1:]:
+                        record_failure(
+                            remaining_id,
+                            reload_error,
+                            None if isinstance(remaining_state, BaseException) else remaining_state,
+                        )
+                    break
+
+        await log_actions(db, actions)
+        return failed
+
+
+async def _load_outreach_targets(
+    db, contact_ids: Sequence[uuid.UUID]
+) -> dict[uuid.UUID, tuple[OutreachContact, ConversationThread | None, list[Row]]]:
+    """
+    Load contacts with their firm, their latest thread and that thread's
+    recent history, in bulk.
+
+    Only the last history_window messages of each thread are fetched, oldest
+    first, so memory per agent run stays bounded however long a conversation
+    grows.
+    """
+    result = await db.execute(
+        select(OutreachContact)
+        .options(selectinload(OutreachContact.firm))
+        .where(OutreachContact.id.in_(contact_ids))
+    )
+    contacts = {contact.id: contact for contact in result.scalars()}
+    if not contacts:
+        return {}
+
+    # Latest thread per contact: DISTINCT ON keeps the first row of each contact
+    result = await db.execute(
+        select(ConversationThread)
+        .where(ConversationThread.contact_id.in_(list(contacts)))
+        .distinct(ConversationThread.contact_id)
+        .order_by(ConversationThread.contact_id, ConversationThread.created_at.desc())
+    )
+    threads = {thread.contact_id: thread for thread in result.scalars()}
+
+    histories: dict[uuid.UUID, list[Row]] = {}
+    if threads:
+        # Rank each thread's messages newest first and keep the top K of every
+        # thread in one query, selecting only the columns the agent reads
+        ranked = (
+            select(
+                ConversationMessage.thread_id,
+                ConversationMessage.direction,
+                ConversationMessage.body_text,
+                ConversationMessage.subject,
+                ConversationMessage.sent_at,
+                ConversationMessage.sentiment,
+                func.row_number()
+                .over(
+                    partition_by=ConversationMessage.thread_id,
+                    order_by=ConversationMessage.sent_at.desc(),
+                )
+                .label("recency"),
+            )
+            .where(ConversationMessage.thread_id.in_([thread.id for thread in threads.values()]))
+            .subquery()
+        )
+        result = await db.execute(
+            select(ranked)
+            .where(ranked.c.recency <= max(settings.history_window, 1))
+            .order_by(ranked.c.thread_id, ranked.c.sent_at)
+        )
+        for message in result:
+            histories.setdefault(message.thread_id, []).append(message)
+
+    targets = {}
+    for contact_id, contact in contacts.items():
+        thread = threads.get(contact_id)
+        history = histories.get(thread.id, []) if thread else []
+        targets[contact_id] = (contact, thread, history)
+    return targets
+
+
+def _build_initial_state(
+    contact: OutreachContact, thread: ConversationThread | None, history: Sequence[Row]
+) -> AgentState:
+    """Agent graph input for one loaded contact and its recent thread history."""
+    thread_history: tuple[dict, ...] = ()
+    gmail_thread_id = None
+    escalation_level = 0
+
+    if thread:
+        gmail_thread_id = thread.gmail_thread_id
+        escalation_level = thread.escalation_level
+        # Serialized once here and shared by reference through every node
+        thread_history = tuple(
+            {
+                "direction": m.direction,
+                "body_text": m.body_text or "",
+                "subject": m.subject or "",
+                "sent_at": m.sent_at.isoformat() if m.sent_at else "",
+                "sentiment": m.sentiment,
+            }
+            for m in history
+        )
+
+    # Calculate days since last contact
+    days_since = 0
+    if contact.last_contacted_at:
+        delta = datetime.now(timezone.utc) - contact.last_contacted_at
+        days_since = delta.days
+
+    # Build initial state
+    initial_state: AgentState = {
+        "contact_id": contact.id,
+        "contact_name": contact.name,
+        "contact_email": contact.email,
+        "contact_title": contact.title or "",
+        "firm_name": contact.firm.name if contact.firm else "Unknown",
+        "current_status": contact.status,
+        "escalation_level": escalation_level,
+        "strategy": get_strategy_for_level(escalation_level),
+        "days_since_last_contact": days_since,
+        "thread_id": thread.id if thread else None,
+        "gmail_thread_id": gmail_thread_id,
+        "thread_history": thread_history,
+        "new_inbound_message": None,
+        "action_decided": None,
+        "action_reasoning": None,
+        "email_composed": None,
+        "analysis_result": None,
+        "send_result": None,
+        "error": None,
+    }
+    return initial_state
+
+
+async def _apply_outcome(
+    db,
+    contact: OutreachContact,
+    thread: ConversationThread | None,
+    escalation_level: int,
+    final_state: dict,
+    actions: list[dict],
+):
+    """
+    Persist what the agent graph decided and did for one contact.
+
+    Audit entries are appended to actions rather than written here; the
+    caller logs them for the whole batch.
+    """
+    action = final_state.get("action_decided", "skip")
+    send_result = final_state.get("send_result")
+    email_composed = final_state.get("email_composed")
+    error = final_state.get("error")
+
+    if action == "mark_cold":
+        contact.status = "cold"
+        await db.commit()
+        actions.append(dict(
+            action_type="mark_cold",
+            contact_id=contact.id,
+            description=f"Marked {contact.name} as cold — {final_state.get('action_reasoning', '')}",
+        ))
+        return
+
+    if action in ("skip", "wait"):
+        actions.append(dict(
+            action_type=action,
+            contact_id=contact.id,
+            description=final_state.get("action_reasoning", ""),
+        ))
+        return
+
+    if send_result and email_composed:
+        # Create or update thread
+        if not thread:
+            thread = ConversationThread(
+                contact_id=contact.id,
+                gmail_thread_id=send_result.get("thread_id"),
+                subject=email_composed.get("subject"),
+                strategy=final_state.get("strategy", "standard"),
+            )
+            db.add(thread)
+            await db.flush()
+        else:
+            thread.gmail_thread_id = send_result.get("thread_id") or thread.gmail_thread_id
+            thread.escalation_level = escalation_level + 1
+            thread.strategy = final_state.get("strategy", thread.strategy)
+
+        # Store outbound message
+        message = ConversationMessage(
+            thread_id=thread.id,
+            gmail_message_id=send_result.get("message_id"),
+            direction="outbound",
+            from_email=f"suchi@agent",
+            to_email=contact.email,
+            subject=email_composed.get("subject"),
+            body_text=email_composed.get("body_text"),
+            body_html=email_composed.get("body_html"),
+        )
+        db.add(message)
+
+        # Update contact status
+        contact.status = "contacted" if contact.status == "new" else contact.status
+        contact.last_contacted_at = datetime.now(timezone.utc)
+
+        # Schedule next follow-up
+        next_days = get_days_until_next_followup(escalation_level)
+        if next_days:
+            contact.next_followup_at = datetime.now(timezone.utc) + timedelta(days=next_days)
+            task = AgentScheduledTask(
+                contact_id=contact.id,
+                task_type="send_followup",
+                scheduled_for=contact.next_followup_at,
+                payload={"escalation_level": escalation_level + 1},
+            )
+            db.add(task)
+
+        await db.commit()
+
+        actions.append(dict(
+            action_type=f"send_{action.replace('send_', '')}",
+            contact_id=contact.id,
+            thread_id=thread.id,
+            description=f"Sent {action} to {contact.name} at {contact.firm.name if contact.firm else 'Unknown'}",
+            output_data={
+                "subject": email_composed.get("subject"),
+                "gmail_message_id": send_result.get("message_id"),
+            },
+            llm_model_used="claude",
+        ))
+
+        logger.info(f"Outreach completed for {contact.name}")
+
+    elif error:
+        actions.append(dict(
+            action_type="error",
+            contact_id=contact.id,
+            description=f"Agent error for {contact.name}",
+            status="failed",
+            error_message=error,
+        ))
+
@@ -3,6 +3,7 @@
 import logging
 import os
 from datetime import datetime, timezone
+from functools import lru_cache
 
 from app.agent.state import AgentState
 from app.agent.escalation import get_strategy_for_level, should_mark_cold, get_days_until_next_followup
@@ -13,13 +14,20 @@ from app.services.gmail_service import gmail_service
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _read_one_pager(path: str, mtime: float) -> str:
+    # Keyed on mtime so an edited file is re-read; otherwise served from memory
+    with open(path, "r") as f:
+        return f.read()
+
+
 def _load_one_pager() -> str:
     """Load Rajamohan's one-pager from disk."""
     try:
         path = settings.one_pager_path
-        if os.path.exists(path):
-            with open(path, "r") as f:
-                return f.read()
+        return _read_one_pager(path, os.path.getmtime(path))
+    except FileNotFoundError:
+        pass
     except Exception as e:
         logger.warning(f"Failed to load one-pager: {e}")
     return "Rajamohan is an experienced technology leader with 20+ years in building scalable platforms, leading engineering teams, and driving digital transformation. He is seeking a CTO role with a 5 Cr+ package."
@@ -85,7 +93,7 @@ async def reason_node(state: AgentState) -> dict:
 
     decision = await llm_service.decide_next_action(
         contact_info=contact_info,
-        thread_history=state.get("thread_history", []),
+        thread_history=state.get("thread_history", ()),
         escalation_level=state["escalation_level"],
         days_since_last_contact=state.get("days_since_last_contact", 0),
     )
@@ -127,15 +135,13 @@ async def compose_node(state: AgentState) -> dict:
     if action in ("skip", "wait", "mark_cold"):
         return {"email_composed": None}
 
-    one_pager = _load_one_pager()
-
     if action == "send_initial":
         logger.info(f"[COMPOSE] Initial email for {state['contact_name']}")
         email = await llm_service.compose_initial_email(
             contact_name=state["contact_name"],
             contact_title=state.get("contact_title", ""),
             firm_name=state["firm_name"],
-            one_pager=one_pager,
+            one_pager=_load_one_pager(),
         )
         return {"email_composed": email}
 
@@ -144,7 +150,7 @@ async def compose_node(state: AgentState) -> dict:
         email = await llm_service.compose_followup(
             contact_name=state["contact_name"],
             firm_name=state["firm_name"],
-            thread_history=state.get("thread_history", []),
+            thread_history=state.get("thread_history", ()),
             escalation_level=state["escalation_level"],
             strategy=state.get("strategy", "standard"),
         )
@@ -157,14 +163,14 @@ async def compose_node(state: AgentState) -> dict:
         # First analyze the response
         analysis = await llm_service.analyze_response(
             message_body=inbound.get("body_text", ""),
-            thread_context=state.get("thread_history", []),
+            thread_context=state.get("thread_history", ()),
         )
 
         # Then compose a reply
         email = await llm_service.compose_response(
             contact_name=state["contact_name"],
             firm_name=state["firm_name"],
-            thread_history=state.get("thread_history", []),
+            thread_history=state.get("thread_history", ()),
             inbound_message=inbound.get("body_text", ""),
             analysis=analysis,
         )
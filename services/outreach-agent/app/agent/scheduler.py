@@ -9,8 +9,8 @@ Four recurring jobs:
 
 import logging
 
+from apscheduler.executors.asyncio import AsyncIOExecutor
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 
 from app.config import settings
 
@@ -18,18 +18,19 @@ logger = logging.getLogger(__name__)
 
 
 def create_scheduler() -> AsyncIOScheduler:
-    """Create APScheduler with database-backed job store for persistence."""
-    # APScheduler needs a synchronous DB URL
-    sync_db_url = settings.database_url.replace("+asyncpg", "").replace(
-        "postgresql+asyncpg", "postgresql"
-    )
+    """
+    Create APScheduler with the default in-memory job store.
 
-    jobstores = {
-        "default": SQLAlchemyJobStore(url=sync_db_url),
-    }
+    All jobs are static and re-registered by setup_jobs() on every start, so a
+    persistent store would add nothing but a sync Postgres driver and pool
+    that block the event loop on job lookups. Durable work lives in the
+    agent_scheduled_tasks table instead.
 
+    Jobs run as coroutines on the app's event loop (AsyncIOExecutor), so their
+    database work goes through the app's own asyncpg pool.
+    """
     scheduler = AsyncIOScheduler(
-        jobstores=jobstores,
+        executors={"default": AsyncIOExecutor()},
         job_defaults={
             "coalesce": True,        # If multiple runs missed, run only once
             "max_instances": 1,       # Only one instance of each job at a time
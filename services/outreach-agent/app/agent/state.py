@@ -5,7 +5,14 @@ from typing import Optional, TypedDict
 
 
 class AgentState(TypedDict):
-    """State maintained across a single agent loop iteration."""
+    """
+    State maintained across a single agent loop iteration.
+
+    Kept as a TypedDict: LangGraph stores each key in its own channel and
+    merges a node's partial return per key, so the state is never copied
+    whole between nodes. A dataclass schema would instead be re-instantiated
+    from the channels for every node call.
+    """
 
     # Identity
     contact_id: uuid.UUID
@@ -23,7 +30,7 @@ class AgentState(TypedDict):
     # Thread context
     thread_id: Optional[uuid.UUID]
     gmail_thread_id: Optional[str]
-    thread_history: list[dict]
+    thread_history: tuple[dict, ...]  # built once per run; nodes only read it
 
     # Inbound message (if any)
     new_inbound_message: Optional[dict]
@@ -0,0 +1,63 @@
+"""Idempotent schema upgrades for databases created before a change to init.sql.
+
+infra/postgres/init.sql only runs against an empty volume, so every schema
+change made there after the first deploy is repeated here. Each statement must
+be safe to run on every startup, against both fresh and existing databases.
+"""
+
+import logging
+
+from sqlalchemy import text
+
+from app.db.session import engine
+
+logger = logging.getLogger(__name__)
+
+UPGRADE_STATEMENTS = (
+    # Persistent job checkpoints (inbox watermark)
+    """
+    CREATE TABLE IF NOT EXISTS agent_job_state (
+        name              VARCHAR(100) PRIMARY KEY,
+        last_run_at       TIMESTAMPTZ NOT NULL,
+        updated_at        TIMESTAMPTZ NOT NULL DEFAULT NOW()
+    )
+    """,
+    # Gmail message ids are unique; inbound messages are inserted ON CONFLICT DO
+    # NOTHING against this index. Before it existed, concurrent inbox runs could
+    # store a message twice, so keep the oldest copy of each id first. The
+    # cleanup only runs while the index is still missing.
+    """
+    DO $$
+    BEGIN
+        IF to_regclass('uq_messages_gmail_message_id') IS NULL THEN
+            DELETE FROM conversation_messages dup
+            USING conversation_messages kept
+            WHERE dup.gmail_message_id = kept.gmail_message_id
+              AND (dup.created_at, dup.id) > (kept.created_at, kept.id);
+        END IF;
+    END
+    $$
+    """,
+    """
+    CREATE UNIQUE INDEX IF NOT EXISTS uq_messages_gmail_message_id
+        ON conversation_messages(gmail_message_id)
+    """,
+    # Partial indexes behind the orphaned-contact NOT EXISTS scan
+    """
+    CREATE INDEX IF NOT EXISTS idx_outreach_contacts_new
+        ON outreach_contacts(id) WHERE status = 'new'
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_scheduled_tasks_live_contact
+        ON agent_scheduled_tasks(contact_id)
+        WHERE status IN ('pending', 'running') AND task_type IN ('send_initial', 'send_followup')
+    """,
+)
+
+
+async def upgrade_schema() -> None:
+    """Apply every upgrade statement in one transaction."""
+    async with engine.begin() as conn:
+        for statement in UPGRADE_STATEMENTS:
+            await conn.execute(text(statement))
+    logger.info(f"[SCHEMA] Applied {len(UPGRADE_STATEMENTS)} upgrade statement(s)")
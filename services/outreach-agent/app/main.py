@@ -27,6 +27,11 @@ async def lifespan(app: FastAPI):
 
     # Late import to avoid circular dependencies
     from app.agent.scheduler import create_scheduler, setup_jobs
+    from app.db.upgrade import upgrade_schema
+
+    # Bring existing databases up to the current schema before any job runs;
+    # a failure here stops startup rather than letting every job fail later
+    await upgrade_schema()
 
     try:
         _scheduler = create_scheduler()
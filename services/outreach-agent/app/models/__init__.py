@@ -5,6 +5,7 @@ from app.models.message import ConversationMessage
 from app.models.action import AgentAction
 from app.models.scheduled_task import AgentScheduledTask
 from app.models.briefing import DailyBriefing
+from app.models.job_state import AgentJobState
 
 __all__ = [
     "OutreachFirm",
@@ -14,4 +15,5 @@ __all__ = [
     "AgentAction",
     "AgentScheduledTask",
     "DailyBriefing",
+    "AgentJobState",
 ]
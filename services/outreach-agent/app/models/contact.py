@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import String, Boolean, DateTime, ForeignKey
+from sqlalchemy import String, Boolean, DateTime, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -36,3 +36,7 @@ class OutreachContact(Base):
     threads: Mapped[list["ConversationThread"]] = relationship(
         back_populates="contact", cascade="all, delete-orphan"
     )
+
+    __table_args__ = (
+        Index("idx_outreach_contacts_new", "id", postgresql_where=text("status = 'new'")),
+    )
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import String, Text, DateTime, ForeignKey
+from sqlalchemy import String, Text, DateTime, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -32,3 +32,7 @@ class ConversationMessage(Base):
     )
 
     thread: Mapped["ConversationThread"] = relationship(back_populates="messages")
+
+    __table_args__ = (
+        Index("uq_messages_gmail_message_id", "gmail_message_id", unique=True),
+    )
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import String, Integer, Text, DateTime, ForeignKey
+from sqlalchemy import String, Integer, Text, DateTime, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -26,3 +26,13 @@ class AgentScheduledTask(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
     )
+
+    __table_args__ = (
+        Index(
+            "idx_scheduled_tasks_live_contact",
+            "contact_id",
+            postgresql_where=text(
+                "status IN ('pending', 'running') AND task_type IN ('send_initial', 'send_followup')"
+            ),
+        ),
+    )
@@ -2,8 +2,9 @@
 
 import logging
 import uuid
-from typing import Optional
+from typing import Optional, Sequence
 
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.action import AgentAction
@@ -56,3 +57,48 @@ async def log_action(
         except Exception:
             pass
         return None
+
+
+ACTION_DEFAULTS = {
+    "contact_id": None,
+    "thread_id": None,
+    "description": None,
+    "input_data": None,
+    "output_data": None,
+    "llm_model_used": None,
+    "llm_tokens_used": None,
+    "status": "completed",
+    "error_message": None,
+}
+
+
+async def log_actions(db: AsyncSession, actions: Sequence[dict]) -> None:
+    """
+    Log several agent actions to the audit trail in one INSERT and one commit.
+
+    Each entry takes the same keyword arguments as log_action. Used by batch
+    jobs that would otherwise pay a commit round-trip per action.
+    """
+    if not actions:
+        return
+
+    # Every row carries the same keys so the INSERT is a single executemany
+    rows = [{**ACTION_DEFAULTS, **action} for action in actions]
+    try:
+        await db.execute(insert(AgentAction), rows)
+        await db.commit()
+
+        for row in rows:
+            error_message = row["error_message"]
+            logger.info(
+                f"[AGENT ACTION] {row['action_type']} | contact={row['contact_id']} | status={row['status']}"
+                f"{f' | error={error_message}' if error_message else ''}"
+            )
+
+    except Exception as e:
+        logger.error(f"Failed to log {len(rows)} agent action(s): {e}")
+        # Don't let logging failures crash the agent
+        try:
+            await db.rollback()
+        except Exception:
+            pass
@@ -2,7 +2,7 @@
 
 import json
 import logging
-from typing import Optional
+from typing import Optional, Sequence
 
 import anthropic
 import openai
@@ -75,7 +75,7 @@ Return JSON only:
         self,
         contact_name: str,
         firm_name: str,
-        thread_history: list[dict],
+        thread_history: Sequence[dict],
         escalation_level: int,
         strategy: str,
     ) -> dict:
@@ -118,7 +118,7 @@ Return JSON only:
         self,
         contact_name: str,
         firm_name: str,
-        thread_history: list[dict],
+        thread_history: Sequence[dict],
         inbound_message: str,
         analysis: dict,
     ) -> dict:
@@ -164,7 +164,7 @@ Return JSON only:
     async def analyze_response(
         self,
         message_body: str,
-        thread_context: list[dict],
+        thread_context: Sequence[dict],
     ) -> dict:
         """
         Analyse an inbound email response.
@@ -229,7 +229,7 @@ Return JSON only."""
     async def decide_next_action(
         self,
         contact_info: dict,
-        thread_history: list[dict],
+        thread_history: Sequence[dict],
         escalation_level: int,
         days_since_last_contact: int,
     ) -> dict:
@@ -367,7 +367,7 @@ Return the briefing text only (no JSON, no markdown)."""
             logger.error(f"LLM call failed: {e}")
             return {}
 
-    def _format_thread_history(self, messages: list[dict]) -> str:
+    def _format_thread_history(self, messages: Sequence[dict]) -> str:
         """Format message history for prompt context."""
         if not messages:
             return "No conversation history."
@@ -51,7 +51,7 @@ async def schedule_initial_tasks_for_contacts(
             AgentScheduledTask.status.in_(["pending", "running"]),
         )
     )
-    already_scheduled = {row[0] for row in existing_result.all()}
+    already_scheduled = set(existing_result.scalars())
 
     to_schedule = [cid for cid in contact_ids if cid not in already_scheduled]
 